@@ -2,3 +2,23 @@
 
 A GUI for inspecting data contained in EVE files.
 """
+
+import importlib.metadata
+import os
+
+
+def _get_version():
+    # The VERSION file is only present in the source tree
+    version_file = os.path.join(os.path.dirname(__file__), "..", "VERSION")
+    try:
+        with open(version_file, encoding="utf8") as file:
+            return file.read().strip()
+    except OSError:
+        pass
+    try:
+        return importlib.metadata.version("evedataviewer")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+__version__ = _get_version()
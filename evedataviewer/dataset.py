@@ -11,12 +11,28 @@ classes are implemented, to allow for a convenient drop-in replacement with
 the radiometry package.
 """
 
-import copy
 import datetime
+import sys
 import warnings
 
 import numpy as np
 
+# Shared default for data and axis values not set yet, read-only as it is
+# shared by all instances and values are always replaced, never modified
+_EMPTY_ARRAY = np.empty(0)
+_EMPTY_ARRAY.setflags(write=False)
+
+
+def _intern(string):
+    # Quantities and units repeat across devices, hence share equal strings
+    return sys.intern(string) if isinstance(string, str) else string
+
+
+def _read_only(array):
+    view = array.view()
+    view.setflags(write=False)
+    return view
+
 
 class Dataset:
     """
@@ -59,6 +75,10 @@ class Dataset:
 
             Set to -1 to temporarily disable subscans.
 
+        Boundaries are replaced as a whole rather than modified in place, as
+        the slices of the subscans are created only once per list of
+        boundaries.
+
     metadata : :class:`DatasetMetadata`
         All relevant metadata for the dataset.
 
@@ -66,6 +86,21 @@ class Dataset:
 
     """
 
+    # Slots save the per-instance dict, as many datasets may be held in
+    # memory. The weak reference slot allows for caching datasets weakly.
+    __slots__ = (
+        "id",
+        "label",
+        "data",
+        "device_data",
+        "_preferred_data",
+        "subscans",
+        "metadata",
+        "_subscan_boundaries",
+        "_subscan_slices",
+        "__weakref__",
+    )
+
     def __init__(self):
         self.id = ""  # pylint: disable=invalid-name
         self.label = ""
@@ -77,6 +112,8 @@ class Dataset:
             "current": -1,
         }
         self.metadata = DatasetMetadata()
+        self._subscan_boundaries = None
+        self._subscan_slices = []
 
     @property
     def preferred_data(self):
@@ -113,21 +150,19 @@ class Dataset:
             self._set_data(device=self._preferred_data[1], kind="data")
 
     def _set_data(self, device="", kind=""):
-        if device not in self.device_data:
+        try:
+            device_data = self.device_data[device]
+        except KeyError:
             warnings.warn("Device not found", UserWarning)
             return
         if kind == "axes":
-            self.data.axes[0].values = self.device_data[device].data
-            self.data.axes[0].quantity = (
-                self.device_data[device].axes[1].quantity
-            )
-            self.data.axes[0].unit = self.device_data[device].axes[1].unit
-        elif kind == "data":
-            self.data.data = self.device_data[device].data
-            self.data.axes[1].quantity = (
-                self.device_data[device].axes[1].quantity
-            )
-            self.data.axes[1].unit = self.device_data[device].axes[1].unit
+            self.data.axes[0].values = device_data.data
+            axis = self.data.axes[0]
+        else:
+            self.data.data = device_data.data
+            axis = self.data.axes[1]
+        axis.quantity = device_data.axes[1].quantity
+        axis.unit = device_data.axes[1].unit
 
     @property
     def devices(self):
@@ -150,12 +185,15 @@ class Dataset:
         """
         Current subscan of data, including data and axes.
 
-        The subscan is a copy of the original data. Hence, all manipulations on
-        a subscan are *not* reflected back to the original data.
+        The subscan is a new :class:`Data` object whose data and axes values
+        are read-only views on the original data, i.e., no values are copied.
+        Hence, the values of a subscan cannot be manipulated in place, and
+        reassigning them is *not* reflected back to the original data.
 
         Both, subscan boundaries and index of the current subscan are set within
         the :attr:`subscans` property. If the index of the current subscan is
-        set to -1, the full data are returned.
+        set to -1, the full data are returned, *i.e.* :attr:`data` itself
+        rather than a copy or view of it.
 
         Returns
         -------
@@ -166,19 +204,32 @@ class Dataset:
         if self.subscans["current"] == -1:
             sliced_data = self.data
         else:
-            slice_ = slice(
-                *[
-                    int(value)
-                    for value in self.subscans["boundaries"][
-                        self.subscans["current"]
-                    ]
-                ]
+            slice_ = self._get_subscan_slices()[self.subscans["current"]]
+            sliced_data = Data()
+            sliced_data.data = _read_only(self.data.data[slice_])
+            sliced_data.axes = [
+                Axis(quantity=axis.quantity, unit=axis.unit)
+                for axis in self.data.axes
+            ]
+            sliced_data.axes[0].values = _read_only(
+                self.data.axes[0].values[slice_]
             )
-            sliced_data = copy.deepcopy(self.data)
-            sliced_data.data = sliced_data.data[slice_]
-            sliced_data.axes[0].values = sliced_data.axes[0].values[slice_]
+            sliced_data.axes[1].values = _read_only(self.data.axes[1].values)
         return sliced_data
 
+    def _get_subscan_slices(self):
+        # Compare by value, as boundaries may be changed in place
+        boundaries = [
+            tuple(boundary) for boundary in self.subscans["boundaries"]
+        ]
+        if boundaries != self._subscan_boundaries:
+            self._subscan_slices = [
+                slice(*[int(value) for value in boundary])
+                for boundary in boundaries
+            ]
+            self._subscan_boundaries = boundaries
+        return self._subscan_slices
+
     def import_from(self, importer):
         """
         Import data from an external source using an importer.
@@ -191,22 +242,52 @@ class Dataset:
         """
         importer.import_into(self)
 
-    def plot(self, figure=None):
+    def plot(self, figure=None, artists=None):
         """
         Plot data
 
+        If artists previously returned for this dataset are provided and
+        still belong to the axes of the figure, they are updated with the
+        current data rather than adding new artists to the axes.
+
         Parameters
         ----------
         figure : :class:`matplotlib.figure.Figure`
             Figure to plot data (in)to
 
+        artists : :class:`list`
+            Artists previously returned by this method to update
+
+        Returns
+        -------
+        artists : :class:`list`
+            Artists (:class:`matplotlib.lines.Line2D`) added to the axes
+
+            Empty if no figure has been provided.
+
         """
         if not figure:
-            return
+            return []
         axes = figure.axes[0]
-        axes.plot(self.subscan.axes[0].values, self.subscan.data, marker=".")
-        axes.set_xlabel(self.subscan.axes[0].label)
-        axes.set_ylabel(self.subscan.axes[1].label)
+        # Slice the values directly rather than creating the subscan object
+        if self.subscans["current"] == -1:
+            slice_ = slice(None)
+        else:
+            slice_ = self._get_subscan_slices()[self.subscans["current"]]
+        xdata = self.data.axes[0].values[slice_]
+        ydata = self.data.data[slice_]
+        if artists and len(artists) == 1 and artists[0].axes is axes:
+            artists[0].set_data(xdata, ydata)
+            axes.relim()
+            axes.autoscale_view()
+        else:
+            artists = axes.plot(xdata, ydata, marker=".")
+        # Setting labels marks the figure as stale even if they are unchanged
+        if axes.get_xlabel() != self.data.axes[0].label:
+            axes.set_xlabel(self.data.axes[0].label)
+        if axes.get_ylabel() != self.data.axes[1].label:
+            axes.set_ylabel(self.data.axes[1].label)
+        return artists
 
 
 class Data:
@@ -217,8 +298,10 @@ class Data:
     framework starts to exist.
     """
 
+    __slots__ = ("data", "axes")
+
     def __init__(self):
-        self.data = np.ndarray([0])
+        self.data = _EMPTY_ARRAY
         self.axes = [Axis(), Axis()]
 
 
@@ -230,10 +313,53 @@ class Axis:
     framework starts to exist.
     """
 
+    __slots__ = ("values", "_quantity", "_unit", "_label")
+
     def __init__(self, quantity="", unit=""):
-        self.values = np.ndarray([0])
-        self.quantity = quantity
-        self.unit = unit
+        self.values = _EMPTY_ARRAY
+        self._quantity = _intern(quantity)
+        self._unit = _intern(unit)
+        self._label = None
+
+    @property
+    def quantity(self):
+        """
+        Quantity of the axis.
+
+        Setting the quantity updates the axis label.
+
+        Returns
+        -------
+        quantity : :class:`str`
+            quantity of the axis
+
+        """
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, quantity=""):
+        self._quantity = _intern(quantity)
+        self._label = None
+
+    @property
+    def unit(self):
+        """
+        Unit of the axis.
+
+        Setting the unit updates the axis label.
+
+        Returns
+        -------
+        unit : :class:`str`
+            unit of the axis
+
+        """
+        return self._unit
+
+    @unit.setter
+    def unit(self, unit=""):
+        self._unit = _intern(unit)
+        self._label = None
 
     @property
     def label(self):
@@ -244,17 +370,22 @@ class Axis:
         not have units in square brackets. Furthermore, the slash is only
         present if a unit is given.
 
+        The label is created only once after quantity or unit changed, as
+        it is requested on every redraw of a plot, whereas quantity and unit
+        are usually set together.
+
         Returns
         -------
         label : :class:`str`
             formatted axis label
 
         """
-        if self.unit:
-            label = " / ".join([self.quantity, self.unit])
-        else:
-            label = self.quantity
-        return label
+        if self._label is None:
+            if self._unit:
+                self._label = " / ".join([self._quantity, self._unit])
+            else:
+                self._label = self._quantity
+        return self._label
 
 
 class DatasetMetadata:
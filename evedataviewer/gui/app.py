@@ -5,6 +5,7 @@ This module provides the high-level interface to the app and a function that
 gets wired up as "gui_script" entry point in the ``setup.py``.
 """
 
+import functools
 import os
 import sys
 
@@ -13,7 +14,9 @@ from PySide6.QtCore import Qt
 
 import qtbricks.utils
 
-from evedataviewer.gui import mainwindow
+_ICON_PATH = qtbricks.utils.image_path(
+    "icon.svg", base_dir=os.path.dirname(__file__)
+)
 
 
 def splash_screen():
@@ -35,17 +38,18 @@ def splash_screen():
         and finally remove it from the screen.
 
     """
-    splash = QtWidgets.QSplashScreen(
-        QtGui.QPixmap(
-            qtbricks.utils.image_path(
-                "icon.svg", base_dir=os.path.dirname(__file__)
-            )
-        )
-    )
+    splash = QtWidgets.QSplashScreen(_icon_pixmap())
     splash.show()
     return splash
 
 
+@functools.lru_cache(maxsize=None)
+def _icon_pixmap():
+    # Rasterise the SVG icon for the splash screen only once; requires a
+    # QApplication instance
+    return QtGui.QPixmap(_ICON_PATH)
+
+
 def main():
     """
     Entry point for the GUI application.
@@ -54,23 +58,28 @@ def main():
     added as "gui_script" entry point. Additionally, the essential
     aspects of the (Qt) application are set that are relevant for saving and
     restoring settings, as well as the window icon.
+
+    To present the splash screen as early as possible, the main window
+    (and with it all modules necessary to load and display data) is
+    imported only after the splash screen has been shown.
     """
     app = QtWidgets.QApplication(sys.argv)
     splash = splash_screen()
+    alignment = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom
+    splash.showMessage("Loading modules...", alignment=alignment)
+    app.processEvents()
 
     app.setOrganizationName("evedataviewer")
     app.setOrganizationDomain("ptb.de")
     app.setApplicationName("evedataviewer")
-    app.setWindowIcon(
-        QtGui.QIcon(
-            qtbricks.utils.image_path(
-                "icon.svg", base_dir=os.path.dirname(__file__)
-            )
-        )
-    )
+    app.setWindowIcon(QtGui.QIcon(_ICON_PATH))
+    # pylint: disable=import-outside-toplevel
+    from evedataviewer.gui import mainwindow
+
+    splash.showMessage("Creating main window...", alignment=alignment)
+    app.processEvents()
     window = mainwindow.MainWindow()
     window.show()
-    alignment = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom
     splash.showMessage("Loaded main window", alignment=alignment)
     splash.finish(window)
 
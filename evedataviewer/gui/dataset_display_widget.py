@@ -64,9 +64,15 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
 
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._update_ui)
+        self._ui_outdated = False
+
         self._model = gui_model.Model()
         self._model.dataset_selection_changed.connect(
-            self._update_ui, QtCore.Qt.UniqueConnection
+            self._queue_update_ui, QtCore.Qt.DirectConnection
         )
 
         # Define all UI elements (widgets) here as non-public attributes
@@ -85,12 +91,13 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
         self._subscan_current_edit = QtWidgets.QLineEdit("0")
         self._subscan_number_label = QtWidgets.QLabel("0")
         self._subscan_label = QtWidgets.QLabel()
+        self._subscan_container = QtWidgets.QWidget()
 
-        self._subscan_widgets = [
-            getattr(self, attr)
-            for attr in dir(self)
-            if attr.startswith("_subscan_")
-        ]
+        # Enabling the container enables all subscan widgets contained
+        self._subscan_widgets = (self._subscan_label, self._subscan_container)
+        self._dataset_combobox_items = []
+        self._axes_models = {}
+        self._no_axes_model = QtCore.QStringListModel(self)
 
         self._setup_ui()
         self._update_ui()
@@ -103,7 +110,10 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
 
         When setting the model, the
         :attr:`evedataviewer.gui.model.Model.dataset_selection_changed` signal is
-        connected to the widget update method.
+        connected to the widget update method. The widget is updated once
+        control returns to the Qt event loop, hence several changes of the
+        model in a row result in only one update. The signal of the model
+        previously set is disconnected.
 
         Parameters
         ----------
@@ -120,9 +130,12 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
 
     @model.setter
     def model(self, model=None):
+        self._model.dataset_selection_changed.disconnect(
+            self._queue_update_ui
+        )
         self._model = model
         self._model.dataset_selection_changed.connect(
-            self._update_ui, QtCore.Qt.UniqueConnection
+            self._queue_update_ui, QtCore.Qt.DirectConnection
         )
 
     def _setup_ui(self):
@@ -145,82 +158,149 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
         self._set_layout()
         self._connect_signals()
 
+    @QtCore.Slot()
     def _update_ui(self):
         """
         Update all the elements of the widget.
 
         This is the once central place taking care of updating all the
         user-facing elements of the widget.
+
+        As long as the widget is not visible, *e.g.* due to its dock widget
+        being closed, updating the axes and subscan widgets is postponed
+        until the widget gets shown. The dataset combobox is always
+        updated, as the current dataset of the model follows its selection.
         """
         self._update_dataset_combobox()
+        if not self.isVisible():
+            self._ui_outdated = True
+            return
+        self._ui_outdated = False
         self._update_axes_comboboxes()
         self._update_subscan_widgets()
 
+    def showEvent(self, event):  # pylint: disable=invalid-name
+        """
+        Update the widget if the model changed while it was hidden.
+
+        Parameters
+        ----------
+        event : :class:`PySide6.QtGui.QShowEvent`
+            Event of the widget getting shown
+
+        """
+        super().showEvent(event)
+        if self._ui_outdated:
+            self._update_ui()
+
+    @QtCore.Slot()
+    def _queue_update_ui(self):
+        # Updating is deferred until control returns to the event loop,
+        # hence several changes of the model in a row update the UI once.
+        self._update_timer.start()
+
     def _update_dataset_combobox(self):
-        dataset_labels = [
-            self.model.datasets[dataset].label
-            for dataset in self.model.datasets_to_display
-        ]
-        combobox_items = [
-            self._dataset_combobox.itemText(idx)
-            for idx in range(self._dataset_combobox.count())
-        ]
-        if dataset_labels != combobox_items:
-            self._dataset_combobox.clear()
-            self._dataset_combobox.addItems(dataset_labels)
+        dataset_labels = self.model.display_labels
+        # Labels are memoised by the model, hence usually identical if equal
+        combobox_items = self._dataset_combobox_items
+        if (
+            dataset_labels is combobox_items
+            or dataset_labels == combobox_items
+        ):
+            return
+        combobox = self._dataset_combobox
+        prefix = 0
+        max_common = min(len(dataset_labels), len(combobox_items))
+        while (
+            prefix < max_common
+            and dataset_labels[prefix] == combobox_items[prefix]
+        ):
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < max_common - prefix
+            and dataset_labels[-suffix - 1] == combobox_items[-suffix - 1]
+        ):
+            suffix += 1
+        # Only the items in between common prefix and suffix get replaced,
+        # retaining the selected item if it is still displayed
+        with QtCore.QSignalBlocker(combobox):
+            for _ in range(len(combobox_items) - prefix - suffix):
+                combobox.removeItem(prefix)
+            combobox.insertItems(
+                prefix, dataset_labels[prefix : len(dataset_labels) - suffix]
+            )
+            if combobox.currentIndex() == -1 and dataset_labels:
+                combobox.setCurrentIndex(0)
+        self._dataset_combobox_items = dataset_labels
+        self._update_model_current_dataset()
 
     def _update_axes_comboboxes(self):
+        # Signals are blocked while repopulating, as intermediate items would
+        # otherwise be set as preferred data of the dataset and replotted.
+        # The items selected finally reflect the preferred data anyway.
+        with QtCore.QSignalBlocker(self._x_axis_combobox):
+            with QtCore.QSignalBlocker(self._y_axis_combobox):
+                self._populate_axes_comboboxes()
+
+    def _populate_axes_comboboxes(self):
+        axes_model, rows = self._no_axes_model, {}
+        preferred = ["", ""]
         if self.model.datasets_to_display:
             selected_dataset = self._dataset_combobox.currentIndex()
             dataset_name = self.model.datasets_to_display[selected_dataset]
-            axes = self.model.datasets[dataset_name].devices
+            axes_model, rows = self._get_axes_model(dataset_name)
             preferred = self.model.datasets[dataset_name].preferred_data
-            self._x_axis_combobox.clear()
-            self._x_axis_combobox.addItems(axes)
-            self._x_axis_combobox.setCurrentIndex(
-                self._x_axis_combobox.findText(preferred[0])
-            )
-            self._y_axis_combobox.clear()
-            self._y_axis_combobox.addItems(axes)
-            self._y_axis_combobox.setCurrentIndex(
-                self._y_axis_combobox.findText(preferred[1])
-            )
-        else:
-            self._x_axis_combobox.clear()
-            self._y_axis_combobox.clear()
-
+        self._x_axis_combobox.setModel(axes_model)
+        self._y_axis_combobox.setModel(axes_model)
+        self._x_axis_combobox.setCurrentIndex(rows.get(preferred[0], -1))
+        self._y_axis_combobox.setCurrentIndex(rows.get(preferred[1], -1))
+        for dataset_name in self._axes_models.keys() - set(
+            self.model.datasets_to_display
+        ):
+            del self._axes_models[dataset_name]
+
+    def _get_axes_model(self, dataset_name=""):
+        # Models are shared by both comboboxes and reused when switching
+        # between datasets, as long as the dataset has not been replaced.
+        # Rows of the devices are stored to select them without searching.
+        dataset = self.model.datasets[dataset_name]
+        if dataset_name in self._axes_models:
+            cached_dataset, axes_model, rows = self._axes_models[dataset_name]
+            if cached_dataset is dataset:
+                return axes_model, rows
+        devices = dataset.devices
+        axes_model = QtCore.QStringListModel(devices)
+        rows = {device: row for row, device in enumerate(devices)}
+        self._axes_models[dataset_name] = (dataset, axes_model, rows)
+        return axes_model, rows
+
+    @QtCore.Slot()
     def _update_subscan_widgets(self):
         selected_dataset = self._dataset_combobox.currentIndex()
         if selected_dataset == -1:
             return
         dataset_name = self.model.datasets_to_display[selected_dataset]
-        if self.model.datasets[dataset_name].subscans["boundaries"]:
-            for widget in self._subscan_widgets:
-                widget.setDisabled(False)
-            if self._subscan_current_edit.text() == "0":
-                self._subscan_decrement_button.setDisabled(True)
-            else:
-                self._subscan_decrement_button.setDisabled(False)
-            n_subscans = len(
-                self.model.datasets[dataset_name].subscans["boundaries"]
+        subscans = self.model.datasets[dataset_name].subscans
+        has_subscans = bool(subscans["boundaries"])
+        for widget in self._subscan_widgets:
+            widget.setEnabled(has_subscans)
+        if has_subscans:
+            n_subscans = len(subscans["boundaries"])
+            # Text is ensured to be an integer by the validator
+            current_subscan = int(self._subscan_current_edit.text())
+            self._subscan_decrement_button.setDisabled(current_subscan == 0)
+            self._subscan_increment_button.setDisabled(
+                current_subscan == n_subscans
             )
-            if self._subscan_current_edit.text() == str(n_subscans):
-                self._subscan_increment_button.setDisabled(True)
-            else:
-                self._subscan_increment_button.setDisabled(False)
             self._subscan_number_label.setText(str(n_subscans))
             self._subscan_current_edit.validator().setTop(n_subscans)
-            self.model.datasets[dataset_name].subscans["current"] = (
-                int(self._subscan_current_edit.text()) - 1
-            )
+            subscans["current"] = current_subscan - 1
             self.model.dataset_changed.emit(dataset_name)
         else:
-            for widget in self._subscan_widgets:
-                widget.setDisabled(True)
-            self._subscan_decrement_button.setDisabled(True)
-            self._subscan_increment_button.setDisabled(True)
             self._subscan_number_label.setText("0")
 
+    @QtCore.Slot()
     def _update_axes_and_subscans(self):
         self._update_model_current_dataset()
         self._update_axes_comboboxes()
@@ -281,6 +361,21 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
         self._normalise_axis_label.setObjectName("normalise_axis_label")
         self._normalise_axis_label.setBuddy(self._normalise_axis_combobox)
 
+        # Sized by a number of characters rather than by measuring the
+        # widths of all items, i.e. of possibly hundreds of devices
+        for combobox in (
+            self._dataset_combobox,
+            self._x_axis_combobox,
+            self._y_axis_combobox,
+            self._normalise_axis_combobox,
+        ):
+            combobox.setSizeAdjustPolicy(
+                QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon
+            )
+            combobox.setMinimumContentsLength(20)
+
+        # Subscan widgets are sized according to the height of a combobox
+        height = self._y_axis_combobox.sizeHint().height()
         self._subscan_decrement_button = qtbricks.utils.create_button(
             text="",
             slot=None,
@@ -289,10 +384,7 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
             checkable=False,
             tooltip="Show previous sub-scan",
         )
-        self._subscan_decrement_button.setFixedSize(
-            self._y_axis_combobox.sizeHint().height(),
-            self._y_axis_combobox.sizeHint().height(),
-        )
+        self._subscan_decrement_button.setFixedSize(height, height)
         self._subscan_increment_button = qtbricks.utils.create_button(
             text="",
             slot=None,
@@ -301,14 +393,8 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
             checkable=False,
             tooltip="Show next sub-scan",
         )
-        self._subscan_increment_button.setFixedSize(
-            self._y_axis_combobox.sizeHint().height(),
-            self._y_axis_combobox.sizeHint().height(),
-        )
-        self._subscan_current_edit.setFixedSize(
-            self._y_axis_combobox.sizeHint().height() * 1.2,
-            self._y_axis_combobox.sizeHint().height(),
-        )
+        self._subscan_increment_button.setFixedSize(height, height)
+        self._subscan_current_edit.setFixedSize(int(height * 1.2), height)
         self._subscan_current_edit.setAlignment(QtCore.Qt.AlignRight)
         validator = qtbricks.utils.IntValidator(0, 999)
         self._subscan_current_edit.setValidator(validator)
@@ -344,8 +430,10 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
         subscans_layout.addWidget(QtWidgets.QLabel("/"))
         subscans_layout.addWidget(self._subscan_number_label)
         subscans_layout.addStretch(1)
+        subscans_layout.setContentsMargins(0, 0, 0, 0)
+        self._subscan_container.setLayout(subscans_layout)
         top_layout.addWidget(self._subscan_label, 6, 0)
-        top_layout.addLayout(subscans_layout, 6, 1)
+        top_layout.addWidget(self._subscan_container, 6, 1)
         layout = QtWidgets.QVBoxLayout()
         layout.addLayout(top_layout)
         layout.addStretch(1)
@@ -387,28 +475,35 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
             self._decrement_current_subscan
         )
 
+    @QtCore.Slot()
     def _set_dataset_preferred_data(self):
         if not self._model.datasets_to_display:
             return
         dataset = self._model.datasets_to_display[
             self._dataset_combobox.currentIndex()
         ]
-        x_axis = self._x_axis_combobox.currentText()
-        y_axis = self._y_axis_combobox.currentText()
-        devices = self.model.datasets[dataset].devices
+        preferred_data = [
+            self._x_axis_combobox.currentText(),
+            self._y_axis_combobox.currentText(),
+        ]
+        # Unchanged axes would only result in replotting the same data
+        if preferred_data == self.model.datasets[dataset].preferred_data:
+            return
+        x_axis, y_axis = preferred_data
+        # membership in the dict is checked without creating a list of devices
+        devices = self.model.datasets[dataset].device_data
         if x_axis and y_axis and x_axis in devices and y_axis in devices:
-            self.model.datasets[dataset].preferred_data = [
-                self._x_axis_combobox.currentText(),
-                self._y_axis_combobox.currentText(),
-            ]
+            self.model.datasets[dataset].preferred_data = preferred_data
             self.model.dataset_changed.emit(dataset)
 
+    @QtCore.Slot()
     def _set_axes_scale(self):
         axes = self.model.figure.axes[0]
         axes.set_xscale(self._x_axis_scale_combobox.currentText())
         axes.set_yscale(self._y_axis_scale_combobox.currentText())
         self.model.plot_changed.emit()
 
+    @QtCore.Slot()
     def _increment_current_subscan(self):
         dataset = self._model.datasets_to_display[
             self._dataset_combobox.currentIndex()
@@ -419,6 +514,7 @@ class DatasetDisplayWidget(QtWidgets.QWidget):
         )
         self._update_subscan_widgets()
 
+    @QtCore.Slot()
     def _decrement_current_subscan(self):
         dataset = self._model.datasets_to_display[
             self._dataset_combobox.currentIndex()
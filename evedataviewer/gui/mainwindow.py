@@ -107,6 +107,7 @@ Module documentation
 
 """
 
+import fnmatch
 import os
 
 from PySide6 import QtWidgets, QtCore
@@ -116,6 +117,7 @@ import qtbricks.mainwindow
 import qtbricks.plot
 import qtbricks.utils
 
+from evedataviewer import utils
 from evedataviewer.gui import model, dataset_display_widget
 from evedataviewer.gui import (
     measurement_characteristics_widget as measurement,
@@ -151,6 +153,12 @@ class MainWindow(qtbricks.mainwindow.MainWindow):
     application level. For details, see the :func:`evedataviewer.gui.app.main`
     function in the :mod:`evedataviewer.gui.app` module.
 
+    Datasets loaded can be cached on disk across sessions (see
+    :class:`evedataviewer.utils.DiskCache`). As this requires disk space,
+    the cache is only used if enabled in the settings by setting
+    ``DiskCache/Enabled`` to true. The maximum size of the cache (in
+    bytes) can be set using ``DiskCache/MaxBytes``, defaulting to 1 GiB.
+
     Attributes
     ----------
     file_browser : :class:`qtbricks.filebrowser.FileBrowser`
@@ -192,8 +200,11 @@ class MainWindow(qtbricks.mainwindow.MainWindow):
 
         self.setMinimumSize(QtCore.QSize(1000, 600))
         self.model = model.Model()
+        self.model.load_asynchronously = True
+        self._set_up_disk_cache()
         self.model.figure = self.plot.figure
         self.file_browser.selection_changed.connect(self._update_model)
+        self.model.current_dataset_changed.connect(self._prefetch_neighbours)
         self.package_name = "evedataviewer"
         self.logo = qtbricks.utils.image_path(
             "icon.svg", base_dir=os.path.dirname(__file__)
@@ -202,15 +213,38 @@ class MainWindow(qtbricks.mainwindow.MainWindow):
         self._dataset_display.model = self.model
         self._measurement_characteristics.model = self.model
 
+    def _set_up_disk_cache(self):
+        settings = QtCore.QSettings()
+        if settings.value("DiskCache/Enabled", False, type=bool):
+            self.model.disk_cache = utils.DiskCache(
+                max_bytes=settings.value(
+                    "DiskCache/MaxBytes", 2**30, type=int
+                )
+            )
+
     def _create_central_widget(self):
         splitter = QtWidgets.QSplitter()
         self.file_browser.setParent(splitter)
         self.plot.setParent(splitter)
         self.setCentralWidget(splitter)
 
+    @QtCore.Slot(set)
     def _update_model(self, datasets):
         self.model.datasets_to_display = list(datasets)
 
+    @QtCore.Slot(str)
+    def _prefetch_neighbours(self, dataset=""):
+        directory = os.path.dirname(dataset)
+        if not dataset or not os.path.isdir(directory):
+            return
+        filters = self.file_browser.model_settings["filters"]
+        files = [
+            os.path.join(directory, name)
+            for name in sorted(os.listdir(directory))
+            if any(fnmatch.fnmatch(name, pattern) for pattern in filters)
+        ]
+        self.model.prefetch_neighbours(current=dataset, all_files=files)
+
     def _create_dock_windows(self):
         dataset_control_layout = QtWidgets.QVBoxLayout()
         dataset_control_layout.addWidget(self._dataset_display)
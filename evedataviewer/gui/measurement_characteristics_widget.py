@@ -14,6 +14,8 @@ individual datasets currently displayed should be handled by other widgets.
 In short: This widget is entirely read-only.
 """
 
+import weakref
+
 from PySide6 import QtWidgets, QtCore
 import qtbricks.widgets
 
@@ -37,7 +39,7 @@ class MeasurementCharacteristicsWidget(QtWidgets.QWidget):
 
         self._model = gui_model.Model()
         self._model.current_dataset_changed.connect(
-            self._update_ui, QtCore.Qt.UniqueConnection
+            self._update_ui, QtCore.Qt.DirectConnection
         )
 
         # Define all UI elements (widgets) here as non-public attributes
@@ -63,6 +65,8 @@ class MeasurementCharacteristicsWidget(QtWidgets.QWidget):
         self._step_width_label = QtWidgets.QLabel()
         self._step_width_value_label = QtWidgets.QLabel()
 
+        self._displayed_dataset = None
+
         self._setup_ui()
         self._update_ui()
 
@@ -73,8 +77,9 @@ class MeasurementCharacteristicsWidget(QtWidgets.QWidget):
         Model of the Model--View architecture used by the widget.
 
         When setting the model, the
-        :attr:`evedataviewer.gui.model.Model.dataset_selection_changed` signal is
-        connected to the widget update method.
+        :attr:`evedataviewer.gui.model.Model.current_dataset_changed` signal is
+        connected to the widget update method, and disconnected from the
+        model previously set.
 
         Parameters
         ----------
@@ -91,9 +96,10 @@ class MeasurementCharacteristicsWidget(QtWidgets.QWidget):
 
     @model.setter
     def model(self, model=None):
+        self._model.current_dataset_changed.disconnect(self._update_ui)
         self._model = model
         self._model.current_dataset_changed.connect(
-            self._update_ui, QtCore.Qt.UniqueConnection
+            self._update_ui, QtCore.Qt.DirectConnection
         )
 
     def _setup_ui(self):
@@ -116,6 +122,7 @@ class MeasurementCharacteristicsWidget(QtWidgets.QWidget):
         self._set_layout()
         self._connect_signals()
 
+    @QtCore.Slot()
     def _update_ui(self):
         """
         Update all the elements of the widget.
@@ -123,21 +130,47 @@ class MeasurementCharacteristicsWidget(QtWidgets.QWidget):
         This is the once central place taking care of updating all the
         user-facing elements of your widget.
         """
-        if not self.model.current_dataset:
+        dataset = None
+        if self.model.current_dataset:
+            dataset = self.model.datasets[self.model.current_dataset]
+        # Selecting the same dataset again would result in the same texts
+        if self._is_displayed(dataset):
+            return
+        if dataset is None:
+            self._displayed_dataset = None
             self._time_start_value_label.setText("")
             self._time_end_value_label.setText("")
             self._duration_value_label.setText("")
             self._location_value_label.setText("")
             return
-        dataset = self.model.datasets[self.model.current_dataset]
-        start = dataset.metadata.measurement.start.replace(microsecond=0)
-        end = dataset.metadata.measurement.end.replace(microsecond=0)
+        # Only weakly referenced not to keep datasets evicted from the model
+        self._displayed_dataset = weakref.ref(dataset)
+        measurement = dataset.metadata.measurement
+        start = measurement.start.replace(microsecond=0)
+        end = measurement.end.replace(microsecond=0)
         self._time_start_value_label.setText(start.isoformat(sep=" "))
         self._time_end_value_label.setText(end.isoformat(sep=" "))
         self._duration_value_label.setText(str(end - start))
-        self._location_value_label.setText(
-            dataset.metadata.measurement.location
-        )
+        self._location_value_label.setText(measurement.location)
+
+    def _is_displayed(self, dataset=None):
+        """
+        Check whether the dataset is the one currently displayed.
+
+        Parameters
+        ----------
+        dataset : :class:`evedataviewer.dataset.Dataset`
+            Dataset to check
+
+        Returns
+        -------
+        displayed : :class:`bool`
+            Whether the dataset is the one currently displayed
+
+        """
+        if dataset is None or self._displayed_dataset is None:
+            return dataset is self._displayed_dataset
+        return self._displayed_dataset() is dataset
 
     def _set_widget_properties(self):
         """
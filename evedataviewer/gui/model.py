@@ -74,13 +74,16 @@ Module documentation
 
 """
 
+import contextlib
+import traceback
+import weakref
+
 from PySide6 import QtCore
 
-import evedataviewer.dataset
-import evedataviewer.io
 from evedataviewer import utils
 
 
+# pylint: disable=too-many-instance-attributes
 class Model(QtCore.QObject):
     """
     Model for the evedataviewer GUI application.
@@ -92,28 +95,32 @@ class Model(QtCore.QObject):
     changes. Thus, views can subscribe to these signals and update
     themselves accordingly.
 
+    Parameters
+    ----------
+    max_cache_bytes : :class:`int`
+        Maximum (estimated) total size of the datasets loaded (in bytes)
+
+        If ``None``, the size is not limited.
+
+        Default: 1 GiB
+
     Attributes
     ----------
-    datasets : :class:`dict`
+    datasets : :class:`evedataviewer.utils.LRUCache`
         Datasets loaded
 
         The keys are the filenames, and the datasets are accessed
         accordingly by their filenames.
 
         .. note::
-            Currently, every dataset once loaded is retained in this dict.
-            If this ever gets a problem due to memory consumption, we will
-            need to implement something taking care of a threshold of memory
-            consumption of this object and starting to delete the oldest
-            (*i.e.* first) entries. Note, however, that the first entry is
-            not necessarily the longest not visited (hence least
-            important) one. Therefore, it might be better to have a second
-            structure containing keys and timestamps of last visit that
-            allow for detecting the longest not-visited dataset.
-
-            For inspiration of a :func:`sys.getsizeof` equivalent that works
-            with containers such as a :class:`dict`,
-            see https://code.activestate.com/recipes/577504/
+            To limit the memory consumption during long sessions, datasets
+            not visited for the longest time are discarded as soon as the
+            estimated total size of all datasets loaded exceeds the
+            threshold given by ``max_cache_bytes`` upon instantiating the
+            model. Datasets currently to be displayed are never discarded.
+            Discarded datasets are simply loaded again if necessary,
+            unless they are still referenced elsewhere and hence can be
+            reused.
 
     figure : :class:`matplotlib.figure.Figure`
         Figure used to plot data
@@ -130,6 +137,28 @@ class Model(QtCore.QObject):
             within the model that the plotter will always be (re)connected
             to the figure.
 
+    load_asynchronously : :class:`bool`
+        Whether to load datasets in a separate thread
+
+        If set, datasets are loaded using the global thread pool, keeping
+        the GUI responsive while loading. In this case, displaying the data
+        and emitting the signals :attr:`dataset_selection_changed` and
+        :attr:`current_dataset_changed` is deferred until all datasets to
+        be displayed are loaded, as views usually access the datasets upon
+        receiving these signals. Datasets failing to load are removed from
+        the datasets to be displayed.
+
+        Default: False
+
+    disk_cache : :class:`evedataviewer.utils.DiskCache`
+        Cache on disk for datasets loaded
+
+        If set, datasets are stored in this cache after loading them from
+        their file, and retrieved from the cache in subsequent sessions as
+        long as the file has not changed, avoiding to parse the file again.
+
+        Default: None
+
     """
 
     dataset_selection_changed = QtCore.Signal(list)
@@ -182,19 +211,64 @@ class Model(QtCore.QObject):
     Signal that should be emitted whenever the plot or its properties change.
     """
 
-    def __init__(self):
+    def __init__(self, max_cache_bytes=2**30):
         super().__init__()
-        self.datasets = {}
         self._datasets_to_display = utils.NotifyingList(
-            callback=self.display_data
+            callback=self._on_datasets_to_display_changed
+        )
+        self._display_set = frozenset()
+        self._display_labels = None
+        self._weak_datasets = weakref.WeakValueDictionary()
+        self.datasets = utils.LRUCache(
+            max_bytes=max_cache_bytes,
+            pinned=self._datasets_to_display,
+            evicted=self._weak_datasets,
         )
         self._current_dataset = ""
         self.figure = None
-        self.dataset_changed.connect(self.display_data)
-        self.plot_changed.connect(self._refresh_plot)
+        # All signals of the model are emitted from the GUI thread
+        self.dataset_changed.connect(
+            self._discard_artists, QtCore.Qt.DirectConnection
+        )
+        self.dataset_changed.connect(
+            self.display_data, QtCore.Qt.DirectConnection
+        )
+        self.dataset_changed.connect(
+            self._invalidate_display_labels, QtCore.Qt.DirectConnection
+        )
+        self.dataset_selection_changed.connect(
+            self.display_data, QtCore.Qt.DirectConnection
+        )
+        self.plot_changed.connect(
+            self._refresh_plot, QtCore.Qt.DirectConnection
+        )
 
         self._display_mode = "plot"
-        self._importer_factory = evedataviewer.io.ImporterFactory()
+        self._display_methods = {}
+        self._importer_factory = None
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_display)
+
+        self._batch_depth = 0
+        self._pending = set()
+
+        self.load_asynchronously = False
+        self.disk_cache = None
+        self._loading = set()
+        self._load_signals = _LoadSignals()
+        # Emitted from worker threads, hence needs to be queued
+        self._load_signals.finished.connect(
+            self._on_loaded, QtCore.Qt.QueuedConnection
+        )
+
+        self._plotted_artists = {}
+        self._stale_artists = {}
+        self._plot_signatures = {}
+        self._canvas = None
+        self._background = None
 
     @property
     def datasets_to_display(self):
@@ -217,13 +291,45 @@ class Model(QtCore.QObject):
 
     @datasets_to_display.setter
     def datasets_to_display(self, datasets):
-        if utils.lists_are_equal(self._datasets_to_display, datasets):
+        # Only (re)setting the same list is a no-op, reordering is a change
+        if (
+            datasets is self._datasets_to_display
+            or datasets == self._datasets_to_display
+        ):
             return
-        self._datasets_to_display = datasets
-        self.display_data()
+        self._datasets_to_display = utils.NotifyingList(
+            datasets, callback=self._on_datasets_to_display_changed
+        )
+        self._display_set = frozenset(self._datasets_to_display)
+        self._display_labels = None
+        self.datasets.pinned = self._datasets_to_display
+        self._load_datasets_to_display()
         if not self.current_dataset:
             self.current_dataset = datasets[0]
-        self.dataset_selection_changed.emit(self._datasets_to_display)
+        self._emit("dataset_selection_changed")
+
+    @property
+    def display_labels(self):
+        """
+        Labels of the datasets to display, in the same order.
+
+        The labels are only collected from the datasets again after the
+        datasets to display changed, a dataset has been (re)loaded, or the
+        signal :attr:`dataset_changed` has been emitted. Hence, do not
+        modify the list returned.
+
+        Returns
+        -------
+        labels : :class:`list`
+            Labels of the datasets to display
+
+        """
+        if self._display_labels is None:
+            self._display_labels = [
+                self.datasets[dataset].label
+                for dataset in self._datasets_to_display
+            ]
+        return self._display_labels
 
     @property
     def current_dataset(self):
@@ -253,10 +359,69 @@ class Model(QtCore.QObject):
 
     @current_dataset.setter
     def current_dataset(self, dataset):
-        if dataset and dataset not in self.datasets_to_display:
+        if dataset and dataset not in self._display_set:
             return
         if self._current_dataset != dataset:
             self._current_dataset = dataset
+            self._emit("current_dataset_changed")
+
+    def _on_datasets_to_display_changed(self):
+        self._display_set = frozenset(self._datasets_to_display)
+        self._display_labels = None
+        self.display_data()
+
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """
+        Defer signals and display of data until leaving the context.
+
+        Changing several properties of the model in a row usually results
+        in emitting signals and displaying the data for each individual
+        change. Within this context, signals and displaying data are
+        deferred and happen only once when leaving the context.
+
+        The context manager is reentrant, *i.e.* contexts can be nested,
+        and signals are only emitted when leaving the outermost context.
+
+        Examples
+        --------
+        Change the datasets to display and the current dataset in one go,
+        resulting in displaying the data and emitting each signal only once:
+
+        .. code-block::
+
+            with model.batch_updates():
+                model.datasets_to_display.append("foo")
+                model.datasets_to_display.append("bar")
+                model.current_dataset = "bar"
+
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._flush_pending()
+
+    def _flush_pending(self):
+        if self._batch_depth or self._loading_datasets_to_display():
+            return
+        pending, self._pending = self._pending, set()
+        if "display" in pending:
+            self.display_data()
+        for signal in (
+            "dataset_selection_changed",
+            "current_dataset_changed",
+        ):
+            if signal in pending:
+                self._emit(signal)
+
+    def _emit(self, signal=""):
+        if self._batch_depth or self._loading_datasets_to_display():
+            self._pending.add(signal)
+        elif signal == "dataset_selection_changed":
+            self.dataset_selection_changed.emit(self._datasets_to_display)
+        elif signal == "current_dataset_changed":
             self.current_dataset_changed.emit(self._current_dataset)
 
     @QtCore.Slot()
@@ -282,6 +447,13 @@ class Model(QtCore.QObject):
             as this method takes care of loading the data if they are not
             yet internally available.
 
+        .. note::
+            Unless :attr:`load_asynchronously` is set, while loading data
+            happens immediately, the actual display is
+            deferred until control returns to the Qt event loop. Hence,
+            several calls in a row, *e.g.* due to adding several datasets
+            one after the other, result in displaying the data only once.
+
         .. note::
             For developers: For maximum flexibility and modularity,
             the actual display mode is used as first part of the method
@@ -290,10 +462,33 @@ class Model(QtCore.QObject):
             and implement all necessary functionality therein.
 
         """
+        self._load_datasets_to_display()
+        if self._batch_depth or self._loading_datasets_to_display():
+            self._pending.add("display")
+            return
+        self._refresh_timer.start()
+
+    def _load_datasets_to_display(self):
+        if self._batch_depth:
+            self._pending.add("display")
+            return
         for dataset in self.datasets_to_display:
-            if dataset not in self.datasets:
+            if dataset in self.datasets or self._reuse_dataset(dataset):
+                continue
+            if self.load_asynchronously:
+                self._load_data_asynchronously(dataset)
+            else:
                 self.load_data(dataset)
-        getattr(self, f"{self._display_mode}_data")()
+
+    @QtCore.Slot()
+    def _do_display(self):
+        try:
+            method = self._display_methods[self._display_mode]
+        except KeyError:
+            # Store functions rather than bound methods to avoid cycles
+            method = getattr(type(self), f"{self._display_mode}_data")
+            self._display_methods[self._display_mode] = method
+        method(self)
 
     def load_data(self, filename=""):
         """
@@ -313,10 +508,112 @@ class Model(QtCore.QObject):
             for a later drop-in replacement with an ASpecD-derived package.
 
         """
-        dataset = evedataviewer.dataset.Dataset()
-        importer = self._importer_factory.get_importer(source=filename)
-        dataset.import_from(importer)
+        if self._reuse_dataset(filename):
+            return
+        self.datasets[filename] = _import_dataset(
+            filename=filename,
+            importer=self._get_importer(filename),
+            disk_cache=self.disk_cache,
+        )
+        self._display_labels = None
+
+    def prefetch_neighbours(self, current="", all_files=None, radius=1):
+        """
+        Load datasets adjacent to the current one in the background.
+
+        Users typically step through neighbouring files. Hence, loading
+        these files in advance while the user inspects the current dataset
+        reduces the time necessary to display the next dataset.
+
+        Datasets are only prefetched if :attr:`load_asynchronously` is set
+        and the datasets loaded occupy less than 80% of the maximum cache
+        size. Prefetching has lower priority than loading datasets to be
+        displayed.
+
+        Parameters
+        ----------
+        current : :class:`str`
+            Name of the current dataset
+
+        all_files : :class:`list`
+            Names of all files in the order they are presented to the user
+
+        radius : :class:`int`
+            Number of neighbours on each side of the current dataset
+
+            Default: 1
+
+        """
+        if not self.load_asynchronously or current not in (all_files or []):
+            return
+        index = all_files.index(current)
+        for filename in all_files[
+            max(index - radius, 0) : index + radius + 1
+        ]:
+            if (
+                self.datasets.max_bytes is not None
+                and self.datasets.size >= 0.8 * self.datasets.max_bytes
+            ):
+                return
+            if filename in self.datasets or self._reuse_dataset(filename):
+                continue
+            self._load_data_asynchronously(filename, priority=-1)
+
+    def _reuse_dataset(self, filename):
+        # Datasets discarded from the cache but still referenced elsewhere
+        dataset = self._weak_datasets.get(filename)
+        if dataset is None:
+            return False
         self.datasets[filename] = dataset
+        self._display_labels = None
+        return True
+
+    def _get_importer(self, filename):
+        if not self._importer_factory:
+            # pylint: disable=import-outside-toplevel
+            import evedataviewer.io
+
+            self._importer_factory = evedataviewer.io.ImporterFactory()
+        return self._importer_factory.get_importer(source=filename)
+
+    def _load_data_asynchronously(self, filename="", priority=0):
+        if filename in self._loading:
+            return
+        self._loading.add(filename)
+        task = _LoadTask(
+            filename=filename,
+            importer=self._get_importer(filename),
+            disk_cache=self.disk_cache,
+            signals=self._load_signals,
+        )
+        QtCore.QThreadPool.globalInstance().start(task, priority)
+
+    def _loading_datasets_to_display(self):
+        return any(
+            dataset in self._loading for dataset in self.datasets_to_display
+        )
+
+    @QtCore.Slot(str, object)
+    def _on_loaded(self, filename, dataset):
+        self._loading.discard(filename)
+        if dataset is None:
+            self._discard_dataset_to_display(filename)
+        else:
+            self.datasets[filename] = dataset
+            self._display_labels = None
+        self._flush_pending()
+
+    def _discard_dataset_to_display(self, filename):
+        # Datasets failing to load would otherwise be loaded over and over
+        if filename not in self._display_set:
+            return
+        with self.batch_updates():
+            self._datasets_to_display.remove(filename)
+            if self._current_dataset == filename:
+                self.current_dataset = next(
+                    iter(self._datasets_to_display), ""
+                )
+            self._emit("dataset_selection_changed")
 
     def plot_data(self):
         """
@@ -325,6 +622,13 @@ class Model(QtCore.QObject):
         If not figure is provided (by means of :attr:`figure`), the method
         silently returns.
 
+        Only datasets not yet plotted are added to, and datasets no longer
+        to be displayed removed from the figure. If the datasets to display
+        have been plotted already, nothing happens. If only datasets have been
+        added and neither axes limits nor labels changed, the new data are
+        drawn using blitting rather than redrawing the entire figure. Lines
+        of datasets whose data changed are updated rather than replaced.
+
         .. todo::
             Should be replaced with a modular approach using plotters,
             similar to what has been done for loading data.
@@ -332,14 +636,215 @@ class Model(QtCore.QObject):
         """
         if not self.figure:
             return
-        self.figure.axes[0].cla()
+        axes = self.figure.axes[0]
+        if (
+            self._check_plotted_artists(axes)
+            and self._plotted_artists.keys() == self._display_set
+            and not self._stale_artists
+        ):
+            return
+        to_remove = self._plotted_artists.keys() - set(
+            self.datasets_to_display
+        )
+        for dataset in to_remove:
+            for artist in self._plotted_artists.pop(dataset):
+                artist.remove()
+        for dataset in self._stale_artists.keys() - self._display_set:
+            for artist in self._stale_artists.pop(dataset):
+                artist.remove()
+        if to_remove or self._background is None:
+            axes.relim()
+            axes.autoscale_view()
+        view = self._get_view(axes)
+        added_artists = []
         for dataset in self.datasets_to_display:
-            self.datasets[dataset].plot(figure=self.figure)
+            if dataset not in self._plotted_artists:
+                stale_artists = self._stale_artists.pop(dataset, [])
+                self._plotted_artists[dataset] = self.datasets[dataset].plot(
+                    figure=self.figure, artists=stale_artists
+                )
+                for artist in stale_artists:
+                    if artist not in self._plotted_artists[dataset]:
+                        artist.remove()
+                self._plot_signatures[dataset] = self._get_plot_signature(
+                    dataset
+                )
+                added_artists.extend(self._plotted_artists[dataset])
+        if (
+            to_remove
+            or self._background is None
+            or self._get_view(axes) != view
+        ):
+            self._redraw()
+        elif added_artists:
+            self._blit(axes, added_artists)
+
+    def _check_plotted_artists(self, axes):
+        if self.figure.canvas is not self._canvas:
+            self._canvas = self.figure.canvas
+            self._background = None
+            if self._canvas.supports_blit:
+                self._canvas.mpl_connect("draw_event", self._store_background)
+        artists = [
+            artist
+            for artists in (
+                *self._plotted_artists.values(),
+                *self._stale_artists.values(),
+            )
+            for artist in artists
+        ]
+        if not artists or any(artist.axes is not axes for artist in artists):
+            axes.cla()
+            self._plotted_artists = {}
+            self._stale_artists = {}
+            return False
+        return True
+
+    def _get_plot_signature(self, dataset=""):
+        # Cheap fingerprint of what gets plotted for a dataset
+        data = self.datasets[dataset].data
+        subscans = self.datasets[dataset].subscans
+        return (
+            id(data.data),
+            data.data.shape,
+            data.data[:1].tobytes(),
+            id(data.axes[0].values),
+            data.axes[0].values.shape,
+            data.axes[0].values[:1].tobytes(),
+            data.axes[0].label,
+            data.axes[1].label,
+            subscans["current"],
+            len(subscans["boundaries"]),
+        )
+
+    @staticmethod
+    def _get_view(axes):
+        return (
+            axes.get_xlim(),
+            axes.get_ylim(),
+            axes.get_xlabel(),
+            axes.get_ylabel(),
+        )
+
+    def _store_background(self, event):
+        if event.canvas is self._canvas:
+            self._background = event.canvas.copy_from_bbox(
+                self.figure.axes[0].bbox
+            )
+
+    def _blit(self, axes, artists):
+        self._canvas.restore_region(self._background)
+        for artist in artists:
+            axes.draw_artist(artist)
+        self._canvas.blit(axes.bbox)
+        self._background = self._canvas.copy_from_bbox(axes.bbox)
+
+    def _redraw(self):
+        # Background is outdated until the figure has actually been redrawn
+        self._background = None
         self.figure.canvas.draw_idle()
 
+    @QtCore.Slot(str)
+    def _discard_artists(self, dataset=""):
+        if dataset not in self._plotted_artists:
+            return
+        signature = self._get_plot_signature(dataset)
+        if self._plot_signatures[dataset] == signature:
+            return
+        # Artists are updated with the changed data when plotting again
+        self._stale_artists[dataset] = self._plotted_artists.pop(dataset)
+        self._background = None
+
+    @QtCore.Slot()
+    def _invalidate_display_labels(self):
+        self._display_labels = None
+
+    @QtCore.Slot()
     def _refresh_plot(self):
+        # Matplotlib must only be accessed from within the GUI thread,
+        # but the signal triggering the refresh may be emitted elsewhere.
+        QtCore.QMetaObject.invokeMethod(
+            self, "_do_refresh_plot", QtCore.Qt.QueuedConnection
+        )
+
+    @QtCore.Slot()
+    def _do_refresh_plot(self):
+        if self._refresh_timer.isActive():
+            return
         if self.figure:
-            self.figure.canvas.draw_idle()
+            self._redraw()
+
+
+def _import_dataset(filename="", importer=None, disk_cache=None):
+    dataset = disk_cache.load(filename) if disk_cache else None
+    if dataset is None:
+        # Deferred, as importing is costly and not necessary for startup
+        # pylint: disable=import-outside-toplevel
+        import evedataviewer.dataset
+
+        dataset = evedataviewer.dataset.Dataset()
+        dataset.import_from(importer)
+        if disk_cache:
+            disk_cache.save(filename, dataset)
+    return dataset
+
+
+class _LoadSignals(QtCore.QObject):
+    """Signals emitted by :class:`_LoadTask` objects."""
+
+    finished = QtCore.Signal(str, object)
+
+
+class _LoadTask(QtCore.QRunnable):
+    """
+    Load a dataset in a separate thread.
+
+    The dataset is handed over by emitting a signal, hence it will be
+    received in the thread the object owning the signal lives in.
+
+    Parameters
+    ----------
+    filename : :class:`str`
+        Name of the file the data should be loaded from
+
+    importer : :class:`evedataviewer.io.Importer`
+        Importer used to load the data
+
+    disk_cache : :class:`evedataviewer.utils.DiskCache`
+        Cache the dataset is retrieved from if present, and stored to
+        otherwise
+
+    signals : :class:`_LoadSignals`
+        Object whose ``finished`` signal gets emitted with filename and
+        dataset once the dataset is loaded
+
+        If loading fails, the error is printed and the signal emitted
+        with ``None`` as dataset.
+
+    """
+
+    def __init__(
+        self, filename="", importer=None, disk_cache=None, signals=None
+    ):
+        super().__init__()
+        self.filename = filename
+        self.importer = importer
+        self.disk_cache = disk_cache
+        self.signals = signals
+
+    def run(self):
+        """Load the dataset and emit the ``finished`` signal."""
+        try:
+            dataset = _import_dataset(
+                filename=self.filename,
+                importer=self.importer,
+                disk_cache=self.disk_cache,
+            )
+        except Exception:  # pylint: disable=broad-except
+            # Exceptions would otherwise get lost in the worker thread
+            traceback.print_exc()
+            dataset = None
+        self.signals.finished.emit(self.filename, dataset)
 
 
 if __name__ == "__main__":
@@ -352,9 +857,10 @@ if __name__ == "__main__":
     model.load_data("foo")
     model.load_data("bar")
 
-    model.datasets_to_display.append("foo")
-    model.datasets_to_display.append("bar")
-    model.datasets_to_display.remove("foo")
+    with model.batch_updates():
+        model.datasets_to_display.append("foo")
+        model.datasets_to_display.append("bar")
+        model.datasets_to_display.remove("foo")
 
     model.datasets_to_display = ["foo", "bar"]
 
@@ -11,6 +11,7 @@ classes are implemented, to allow for a convenient drop-in replacement with
 the radiometry package.
 """
 import datetime
+import functools
 import os
 import random
 import string
@@ -20,6 +21,16 @@ import numpy as np
 from evedataviewer import paradise
 from evedataviewer import dataset as eve_dataset
 
+# Files reported during this session, see report_problematic_file()
+_REPORTED_FILES = set()
+
+# Deterministic parts of the data created by DummyImporter
+_DUMMY_XDATA = np.arange(0.0, 4.0, 0.01)
+_DUMMY_AXIS_VALUES = np.linspace(1, len(_DUMMY_XDATA), len(_DUMMY_XDATA))
+# Read-only as it is shared by all data created, values are only replaced
+_DUMMY_AXIS_VALUES.setflags(write=False)
+_DUMMY_RNG = np.random.default_rng()
+
 
 def report_problematic_file(filename=""):
     """
@@ -30,17 +41,23 @@ def report_problematic_file(filename=""):
     the user's home directory. The log file is currently hard-coded to
     ``~/.paradise_problematic_files``.
 
+    As users often select the same file several times, each file is only
+    reported once per session, avoiding both, duplicate entries and
+    writing to the log file again. Files that could not be written to the
+    log file are reported again.
+
     Parameters
     ----------
     filename : :class:`str`
         Name (usually the full path) of the problematic file to be reported
 
     """
-    if not filename:
+    if not filename or filename in _REPORTED_FILES:
         return
     logfile = os.path.expanduser("~/.paradise_problematic_files")
     with open(logfile, "a", encoding="utf-8") as file:
         file.write(f"{filename}\n")
+    _REPORTED_FILES.add(filename)
 
 
 class ImporterFactory:
@@ -67,14 +84,18 @@ class ImporterFactory:
             The source is passed on to the importer.
 
         """
-        if os.path.splitext(source)[1] == ".h5":
-            importer = EveHDF5Importer()
-            importer.source = source
-        else:
-            importer = DummyImporter()
-            importer.source = source
+        extension = os.path.splitext(source)[1]
+        importer = ImporterFactory._get_importer_class(extension)()
+        importer.source = source
         return importer
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_importer_class(extension=""):
+        if extension == ".h5":
+            return EveHDF5Importer
+        return DummyImporter
+
 
 class Importer:
     """
@@ -161,10 +182,11 @@ class DummyImporter(Importer):
     @staticmethod
     def _create_data(channel_name="intensity"):
         data = eve_dataset.Data()
-        xdata = np.arange(0.0, 4.0, 0.01)
-        ydata = np.sin(4 * np.pi * xdata * np.random.random(1))
+        ydata = np.empty_like(_DUMMY_XDATA)
+        np.multiply(_DUMMY_XDATA, 4 * np.pi * _DUMMY_RNG.random(), out=ydata)
+        np.sin(ydata, out=ydata)
         data.data = ydata
-        data.axes[0].values = np.linspace(1, len(xdata), len(xdata))
+        data.axes[0].values = _DUMMY_AXIS_VALUES
         data.axes[0].quantity = "PosCounter"
         data.axes[0].unit = ""
         data.axes[1].quantity = channel_name
@@ -208,10 +230,16 @@ class EveHDF5Importer(Importer):
 
     def _import_raw_data(self):
         try:
-            self._data = paradise.StandardMeasurement(self.source)
-        except ValueError:
-            self._data = paradise.EVEMeasurement(self.source)
-            self._data.data = self._data.standard_data
+            measurement = paradise.EVEMeasurement(self.source)
+            # Falling back to the measurement parsed already if the file
+            # is no standard measurement avoids parsing the file twice
+            try:
+                self._data = paradise.StandardMeasurement.from_measurement(
+                    measurement
+                )
+            except ValueError:
+                measurement.data = measurement.standard_data
+                self._data = measurement
         except KeyError:
             report_problematic_file(filename=self.source)
             print(
@@ -220,23 +248,25 @@ class EveHDF5Importer(Importer):
             )
 
     def _create_device_data(self):
-        for column in self._data.data.columns:
+        # All devices share the index as axis, hence use one array for all
+        index = self._data.data.index.to_numpy()
+        index_name = self._data.data.index.name
+        units = self._data.units
+        # Iterating over the columns avoids looking up each column by name
+        for column, values in self._data.data.items():
             device_data = eve_dataset.Data()
-            device_data.data = self._data.data[column].to_numpy()
-            device_data.axes[0].values = self._data.data.index.to_numpy()
-            device_data.axes[0].quantity = self._data.data.index.name
+            device_data.data = values.to_numpy()
+            device_data.axes[0].values = index
+            device_data.axes[0].quantity = index_name
             device_data.axes[1].quantity = column
-            if column in self._data.units:
-                device_data.axes[1].unit = self._data.units[column]
-            else:
-                device_data.axes[1].unit = ""
+            device_data.axes[1].unit = units.get(column, "")
             self._dataset.device_data[column] = device_data
         # Add "PosCounter" as "dummy" device to be able to set it as axis
         position_counter = eve_dataset.Data()
-        position_counter.data = self._data.data.index.to_numpy()
-        position_counter.axes[0].values = self._data.data.index.to_numpy()
-        position_counter.axes[0].quantity = self._data.data.index.name
-        position_counter.axes[1].quantity = self._data.data.index.name
+        position_counter.data = index
+        position_counter.axes[0].values = index
+        position_counter.axes[0].quantity = index_name
+        position_counter.axes[1].quantity = index_name
         self._dataset.device_data["PosCounter"] = position_counter
 
     def _handle_preferred_data(self):
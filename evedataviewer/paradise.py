@@ -34,6 +34,7 @@ __author__ = "Mika Pflüger <mika.pflueger@ptb.de>"
 __version__ = "2018-01-31"
 
 import datetime
+import functools
 import logging
 import os
 import os.path
@@ -43,20 +44,57 @@ import numpy as np
 import pandas as pd
 
 
-# TODO: parsing failes with oom if index (PosCounter) contains lots of NaNs, which result in a very large join
+@functools.lru_cache(maxsize=4096)
+def _decode(value):
+    # attribute values like DeviceType or unit repeat across all leaves of a file, hence share the decoded strings
+    return value.decode("latin-1")
 
 
 def _attrs_to_dict(attrs):
-    ret = dict()
-    for key, val in attrs.items():
-        if len(val) == 1:
-            ret[key] = val[0].decode("latin-1")
-        else:
-            ret[key] = [x.decode("latin-1") for x in val]
-    return ret
-
-
-def _process_group(group: h5py.Group):
+    return {
+        key: _decode(val[0]) if len(val) == 1 else [_decode(x) for x in val]
+        for key, val in attrs.items()
+    }
+
+
+def _drop_duplicate_index(df):
+    # PosCounter may occur multiple times in real files in the wild. Joining such leaves multiplies the rows of each
+    # duplicate PosCounter, eventually failing with oom, hence keep only the first row.
+    if df.index.is_unique:
+        return df
+    logging.info("Dropping rows with duplicate index %r", df.index.name)
+    return df[~df.index.duplicated(keep="first")]
+
+
+def _join_dataframes(dfs):
+    # pd.concat builds the joined index only once and is hence much faster than joining successively
+    # usually, all leaves share the same index, hence uniqueness needs to be checked only once
+    index = dfs[0].index
+    shared_index = all(df.index.equals(index) for df in dfs[1:])
+    if not (shared_index and index.is_unique):
+        dfs = [_drop_duplicate_index(df) for df in dfs]
+    small_ints = [
+        col
+        for df in dfs
+        for col, dtype in df.dtypes.items()
+        if dtype.kind in "iu" and dtype.itemsize <= 2
+    ]
+    if not shared_index and all(
+        df.index.is_monotonic_increasing for df in dfs
+    ):
+        # PosCounters are usually sorted, and the union of sorted indices is built by merging rather than sorting
+        index = functools.reduce(pd.Index.union, (df.index for df in dfs))
+        dfs = [df.reindex(index) for df in dfs]
+    joined = pd.concat(dfs, axis=1, sort=True, verify_integrity=True)
+    # integer columns are widened to float64 if missing values need to be filled in. For integers of up to 16 bits,
+    # float32 represents all values exactly and needs only half the memory
+    widened = [col for col in small_ints if joined[col].dtype == np.float64]
+    if widened:
+        joined[widened] = joined[widened].astype(np.float32)
+    return joined
+
+
+def _process_group(group: h5py.Group, group_filter=None):
     logging.debug("Processing group %r", group.name)
     children = {}
     data_dfs = {}
@@ -69,25 +107,67 @@ def _process_group(group: h5py.Group):
             info = _attrs_to_dict(child.attrs)
             # if an EVE channel is a H5 group, we need to parse it as a series of arrays
             if isinstance(child, h5py.Group):
-                index = []
-                data = []
-                for pos_counter, val in child.items():
-                    index.append(int(pos_counter))
-                    data.append(val[...])
+                # read each array only once into preallocated containers, avoiding growing lists item by item
+                pos_counters = list(child)
+                index = np.fromiter(
+                    map(int, pos_counters),
+                    dtype=np.int64,
+                    count=len(pos_counters),
+                )
+                data = np.empty(len(pos_counters), dtype=object)
+                # opening the arrays via the low-level API is much faster than indexing the group. Numerical arrays
+                # of the same shape and type (the usual case) are read directly into rows of a single buffer.
+                dataset_ids = [
+                    h5py.h5d.open(child.id, pos_counter.encode())
+                    for pos_counter in pos_counters
+                ]
+                shapes = {dataset_id.shape for dataset_id in dataset_ids}
+                dtypes = {dataset_id.dtype for dataset_id in dataset_ids}
+                if (
+                    len(shapes) == 1
+                    and len(dtypes) == 1
+                    and next(iter(dtypes)).kind in "biufc"
+                ):
+                    buffer = np.empty(
+                        (len(dataset_ids), *shapes.pop()), dtype=dtypes.pop()
+                    )
+                    for i, dataset_id in enumerate(dataset_ids):
+                        data[i] = buffer[i, ...]
+                        dataset_id.read(h5py.h5s.ALL, h5py.h5s.ALL, data[i])
+                else:
+                    for i, dataset_id in enumerate(dataset_ids):
+                        data[i] = h5py.Dataset(dataset_id)[...]
                 df = pd.DataFrame(
                     pd.Series(index=index, data=data, name=name)
                 )
             else:  # simple channel, can be directly parsed as DataFrame
-                df = pd.DataFrame(child[...])
-                if "PosCounter" in df.columns:
-                    df.set_index("PosCounter", inplace=True)
+                values = child[...]
+                if values.dtype.names:
+                    # wrap the fields of the compound array without copying them column by column, except for
+                    # bytes, which get converted to python strings below, and build the index right away
+                    # instead of moving a column into it afterwards
+                    columns = {
+                        field: (
+                            values[field].astype(object)
+                            if values.dtype[field].kind == "S"
+                            else values[field]
+                        )
+                        for field in values.dtype.names
+                    }
+                    if "PosCounter" in columns:
+                        index_name = "PosCounter"
+                    else:
+                        index_name = values.dtype.names[0]
+                        joindata = False
+                    index = pd.Index(columns.pop(index_name), name=index_name)
+                    df = pd.DataFrame(columns, index=index, copy=False)
                 else:
+                    df = pd.DataFrame(values)
                     df.set_index(df.columns[0], inplace=True)
                     joindata = False
                 # convert from bytes to python strings
-                for col in df.columns:
-                    if df[col].dtype == np.object_:
-                        df[col] = df[col].str.decode("utf-8")
+                for col in df.select_dtypes(include=[np.object_]).columns:
+                    df[col] = df[col].str.decode("utf-8")
 
             if group.name.endswith("/averagemeta") or group.name.endswith(
                 "/standarddev"
@@ -137,8 +217,9 @@ def _process_group(group: h5py.Group):
             metadata[name] = info
 
         elif isinstance(child, h5py.Group):
-            # subgroups are parsed recursively
-            children[name] = _process_group(child)
+            # subgroups are parsed recursively, the filter applies to the top level only
+            if group_filter is None or group_filter(name):
+                children[name] = _process_group(child)
 
         else:  # ??
             logging.warning("Unknown H5 node: {!r}, skipping.".format(name))
@@ -150,12 +231,7 @@ def _process_group(group: h5py.Group):
     ret["info"] = _attrs_to_dict(group.attrs)
     if data_dfs:
         if joindata:
-            # we use df.join instead of pd.concat because pd.concat refuses to work on indices containing PosCounter
-            # multiple times, but those happen in real files in the wild.
-            data_dfs = list(data_dfs.values())
-            df = data_dfs[0]
-            df = df.join(data_dfs[1:], how="outer")
-            ret["data"] = df
+            ret["data"] = _join_dataframes(list(data_dfs.values()))
             ret["metadata"] = metadata
         else:
             ret["data"] = data_dfs
@@ -163,7 +239,7 @@ def _process_group(group: h5py.Group):
     return ret
 
 
-def parse_eve_hdf5(filename):
+def parse_eve_hdf5(filename, group_filter=None):
     """Low-level interface to parse an EVE h5 file into native python datatypes. Useful if you need the exact structure
     of the underlying EVE h5 file or higher-level interfaces don't work for your h5 file.
 
@@ -175,7 +251,8 @@ def parse_eve_hdf5(filename):
     with the following fields:
       'data': included only if the group contains h5 Datasets. If all Datasets share PosCountTimer as index, the data
               is joined (but not filled) in a single pandas DataFrame with PosCountTimer as index and the individual
-              Datasets as columns. Otherwise, the data is a dict of DataFrames, with the key being the name of the h5
+              Datasets as columns. For PosCounters occurring multiple times in a Dataset, only the first row is
+              kept. Otherwise, the data is a dict of DataFrames, with the key being the name of the h5
               leaf.
       'metadata': included only if the group contains h5 Datasets. Is a dict with the leaf names as keys and their
               parsed h5 attributes (represented as dict) as values.
@@ -184,11 +261,21 @@ def parse_eve_hdf5(filename):
               group node dict as value.
     group names are always the last-level h5 names, while leafs use their 'Name' h5 attr if it available and h5 names
     otherwise.
+    If group_filter is given, it is called with the name of each top-level group, and only groups for which it returns
+    True are parsed, saving the time to read data that is not needed.
     """
     with h5py.File(filename, "r") as h5:
         # strategy: we recursively walk all groups and leafs, joining all leafs in a group into a single DataFrame
         # if possible
-        return _process_group(h5["/"])
+        return _process_group(h5["/"], group_filter=group_filter)
+
+
+def _is_chain(name):
+    return name.startswith("c") and name[1:].isdigit()
+
+
+def _is_chain_or_device(name):
+    return _is_chain(name) or name == "device"
 
 
 def _parse_datetime(info):
@@ -201,6 +288,60 @@ def _parse_datetime(info):
         return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _split_column(column):
+    """Split a stddev or averagemeta column name into channel, its parts before and after '__' and type.
+
+    The part after '__' is None if the channel contains no '__'. Channel names recur across the chains and files of
+    a session, hence the result is cached."""
+    cachannel, typ = column.rsplit("_", 1)
+    if "__" in cachannel:
+        cachannel_part, canorm_part = cachannel.rsplit("__", 1)
+    else:
+        cachannel_part, canorm_part = cachannel, None
+    return cachannel, cachannel_part, canorm_part, typ
+
+
+def _split_devices(metadata):
+    """Return the names of motors and sensors in metadata, collected in a single pass."""
+    motors = []
+    sensors = []
+    for name, meta in metadata.items():
+        device_type = meta.get("DeviceType")
+        if device_type == "Axis":
+            motors.append(name)
+        elif device_type == "Channel":
+            sensors.append(name)
+    return motors, sensors
+
+
+def _format_preferred(measurement):
+    """Return the parts of the string representation of measurement showing the preferred axis and channels."""
+    for name in (
+        "preferred_axis",
+        "preferred_channel",
+        "preferred_normalization_channel",
+    ):
+        value = getattr(measurement, name)
+        if value is not None:
+            yield f", {name}: {value!r}"
+
+
+class _ChainAttribute:
+    """Attribute of EVEMeasurement that is read from and written to the selected chain."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance.chain, self.name)
+
+    def __set__(self, instance, value):
+        setattr(instance.chain, self.name, value)
+
+
 class EVEMeasurement:
     """Class to read EVE Measurements. Can be used to read any measurement produced by EVECSS.
     Usage:
@@ -254,9 +395,26 @@ class EVEMeasurement:
     if x and/or y are not specified.
     """
 
+    # the frequently used attributes of the selected chain are looked up directly, everything else via __getattr__
+    standard_data = _ChainAttribute()
+    snapshot_data = _ChainAttribute()
+    timestamp_data = _ChainAttribute()
+    units = _ChainAttribute()
+    standard_metadata = _ChainAttribute()
+    snapshot_metadata = _ChainAttribute()
+    timestamp_metadata = _ChainAttribute()
+    preferred_axis = _ChainAttribute()
+    preferred_channel = _ChainAttribute()
+    preferred_normalization_channel = _ChainAttribute()
+    standard_motors = _ChainAttribute()
+    standard_sensors = _ChainAttribute()
+    snapshot_motors = _ChainAttribute()
+    snapshot_sensors = _ChainAttribute()
+
     def __init__(self, filename):
         self.filename = filename
-        h5 = parse_eve_hdf5(filename)
+        # only chains and monitored devices are used, hence there is no need to parse other groups
+        h5 = parse_eve_hdf5(filename, group_filter=_is_chain_or_device)
         # Parse the most useful/important attributes for direct access
         # access via info dict for the less important attributes
         self.info = h5["info"]
@@ -280,13 +438,7 @@ class EVEMeasurement:
 
         # put chains into structure for direct access
         self.chains = []
-        chain_names = sorted(
-            [
-                x
-                for x in h5["children"]
-                if x.startswith("c") and x[1:].isdigit()
-            ]
-        )
+        chain_names = sorted([x for x in h5["children"] if _is_chain(x)])
         for cname in chain_names:
             self.chains.append(
                 Chain(
@@ -297,15 +449,26 @@ class EVEMeasurement:
         # if we have monitored devices, put them into a structure for direct access
         self.monitor = {}
         if "device" in h5["children"]:
+            if self.start is not None:
+                # the start time has a resolution of seconds, hence adding the milliseconds since start can be
+                # done in integer arithmetic and the result viewed as datetimes without parsing
+                start_ms = round(self.start.timestamp() * 1000)
             for name, df in h5["children"]["device"]["data"].items():
                 if (
                     self.start is not None
                     and df.index.name == "mSecsSinceStart"
                 ):
-                    df.index = pd.to_datetime(
-                        df.index + self.start.timestamp() * 1000, unit="ms"
-                    )
-                    df.index.name = "datetime"
+                    if df.index.dtype.kind in "iu":
+                        ms = df.index.to_numpy(dtype=np.int64) + start_ms
+                        df.index = pd.DatetimeIndex(
+                            ms.view("datetime64[ms]"), name="datetime"
+                        )
+                    else:
+                        # e.g. missing timestamps (NaN) resulting in NaT
+                        df.index = pd.to_datetime(
+                            df.index + start_ms, unit="ms"
+                        )
+                        df.index.name = "datetime"
                 self.monitor[name] = df
 
         if not self.monitor:
@@ -332,21 +495,35 @@ class EVEMeasurement:
         return list(self.__dict__.keys()) + dir(self.chain)
 
     def __str__(self):
-        ret = "<EVEMeasurement file: {!r}, comment: {}, start: {}, evedataviewer: {}, chains: [{}]".format(
-            self.filename,
-            self.comment,
-            self.start,
-            self.evedataviewer,
-            ", ".join((str(chain) for chain in self.chains)),
-        )
+        chains = ", ".join(str(chain) for chain in self.chains)
+        parts = [
+            f"<EVEMeasurement file: {self.filename!r}, comment: {self.comment}, start: {self.start}, "
+            f"evedataviewer: {self.evedataviewer}, chains: [{chains}]"
+        ]
         if self.monitor:
-            ret += ", monitor: {}".format(list(self.monitor.keys()))
-        return ret + ">"
+            parts.append(f", monitor: {list(self.monitor.keys())}")
+        parts.append(">")
+        return "".join(parts)
 
 
 class Chain:
     """Represents a single chain. Documentation see EVEMeasurement."""
 
+    # suffixes of the stddev and averagemeta columns and their human-readable replacements
+    _stddev_suffixes = {
+        "Count": "_stddev_count",
+        "StandardDeviation": "_stddev",
+        "TriggerIntv": "_stddev_trigger_interval",
+    }
+    _averagemeta_suffixes = {
+        "AverageCount": "_av_count",
+        "Attempts": "_av_attempts",
+        "Limit": "_av_limit",
+        "maxDeviation": "_av_max_deviation",
+        "MaxAttempts": "_av_max_attempts",
+        "Preset": "_av_preset",
+    }
+
     def __init__(self, chain, eve_h5_version: float):
         # parse the most useful/important attributes for direct access, info dict for the rest.
         self.info = chain["info"]
@@ -393,15 +570,17 @@ class Chain:
         else:
             self.snapshot_data = snapshot_group["data"]
             self.snapshot_metadata = snapshot_group["metadata"]
+        # further columns are collected and added to the standard data all at once at the end, as joining them one
+        # after the other would copy the standard data each time
+        frames = [self.standard_data]
+        index = self.standard_data.index
         try:
             self.timestamp_data = chain["children"]["meta"]["data"]
             self.timestamp_metadata = chain["children"]["meta"]["metadata"]
             self.timestamp_data["PosCountTimer"] = pd.to_timedelta(
                 self.timestamp_data["PosCountTimer"], unit="ms"
             )
-            self.standard_data = self.standard_data.join(
-                self.timestamp_data, how="left"
-            )
+            frames.append(self.timestamp_data.reindex(index))
             self.standard_metadata.update(self.timestamp_metadata)
             if self.snapshot_data is not None:
                 self.snapshot_data = self.snapshot_data.join(
@@ -423,9 +602,8 @@ class Chain:
                 columns={col: col + "_norm" for col in norm["data"].columns},
                 inplace=True,
             )
-            self.standard_data = self.standard_data.join(
-                norm["data"], how="outer"
-            )
+            frames.append(norm["data"])
+            index = index.union(norm["data"].index)
             for key, val in norm["metadata"].items():
                 self.standard_metadata[key + "_norm"] = val
 
@@ -468,125 +646,39 @@ class Chain:
             except KeyError:
                 self.units[name] = " / ".join((self.units[name], "1"))
 
-        # if we have stddev channels, add them to the standard data with the respective suffix
-        if (
-            "children" in standard_group
-            and "standarddev" in standard_group["children"]
+        # if we have stddev or averagemeta channels, add them to the standard data with the suffixes _stddev* and
+        # _av_*, respectively
+        for group_name, typ_trans in (
+            ("standarddev", self._stddev_suffixes),
+            ("averagemeta", self._averagemeta_suffixes),
         ):
-            logging.debug("Adding standarddev information")
-            stddev = standard_group["children"]["standarddev"]
-            stddev_meta = stddev["metadata"]
-            df = stddev["data"]
-            typ_trans = {
-                "Count": "_stddev_count",
-                "StandardDeviation": "_stddev",
-                "TriggerIntv": "_stddev_trigger_interval",
-            }
-            renames = {}
-            for col in df.columns:
-                cachannel, typ = col.rsplit("_", 1)
-                typ = typ_trans[typ]
-                # if cachannel contains '__', the channel is likely normalized and we have to look in stddev_meta for
-                # the normalization channel
-                channel = None
-                if "__" in cachannel:
-                    cachannel_part, canorm_part = cachannel.rsplit("__", 1)
-                    try:
-                        channel_part = self._name_translation[cachannel_part]
-                        channel_meta = stddev_meta[channel_part]
-                        nid = (
-                            "NormalizeChannelID"
-                            if "NormalizeChannelID" in channel_meta
-                            else "normalizeId"
-                        )
-                        if (
-                            nid in channel_meta
-                        ):  # channel is actually normalized
-                            norm_part = self._name_translation[canorm_part]
-                            channel = "/".join((channel_part, norm_part))
-                    except KeyError:
-                        pass
-
-                if channel is None:
-                    channel = self._name_translation[cachannel]
-
-                renames[col] = channel + typ
-
-            df.rename(columns=renames, inplace=True)
-            self.standard_data = self.standard_data.join(df, how="left")
-
-        # if we have averagemeta channels, add them to the standard data with the suffix _av_*
-        if (
-            "children" in standard_group
-            and "averagemeta" in standard_group["children"]
-        ):
-            logging.debug("Adding averagemeta information")
-            avmeta = standard_group["children"]["averagemeta"]
-            avmeta_meta = avmeta["metadata"]
-            df = avmeta["data"]
-            typ_trans = {
-                "AverageCount": "_av_count",
-                "Attempts": "_av_attempts",
-                "Limit": "_av_limit",
-                "maxDeviation": "_av_max_deviation",
-                "MaxAttempts": "_av_max_attempts",
-                "Preset": "_av_preset",
-            }
-            renames = {}
-            for col in df.columns:
-                cachannel, typ = col.rsplit("_", 1)
-                typ = typ_trans[typ]
-                # if cachannel contains '__', the channel is likely normalized and we have to look in avmeta_meta for
-                # the normalization channel
-                channel = None
-                if "__" in cachannel:
-                    cachannel_part, canorm_part = cachannel.rsplit("__", 1)
-                    try:
-                        channel_part = self._name_translation[cachannel_part]
-                        channel_meta = avmeta_meta[channel_part]
-                        nid = (
-                            "NormalizeChannelID"
-                            if "NormalizeChannelID" in channel_meta
-                            else "normalizeId"
-                        )
-                        if (
-                            nid in channel_meta
-                        ):  # channel is actually normalized
-                            norm_part = self._name_translation[canorm_part]
-                            channel = "/".join((channel_part, norm_part))
-                    except KeyError:
-                        pass
-
-                if channel is None:
-                    channel = self._name_translation[cachannel]
-
-                renames[col] = channel + typ
-
-            df.rename(columns=renames, inplace=True)
+            if (
+                "children" in standard_group
+                and group_name in standard_group["children"]
+            ):
+                logging.debug("Adding %s information", group_name)
+                group = standard_group["children"][group_name]
+                df = group["data"]
+                df.rename(
+                    columns=self._translate_columns(
+                        df.columns, typ_trans, group["metadata"]
+                    ),
+                    inplace=True,
+                )
+                frames.append(df.reindex(index))
 
-            self.standard_data = self.standard_data.join(df, how="left")
+        if len(frames) > 1:
+            self.standard_data = pd.concat(
+                frames, axis=1, sort=True, verify_integrity=True
+            )
 
         # generate a list of motors and sensors for snapshots as well as standard data
-        self.standard_motors = [
-            k
-            for (k, v) in self.standard_metadata.items()
-            if v.get("DeviceType") == "Axis"
-        ]
-        self.standard_sensors = [
-            k
-            for (k, v) in self.standard_metadata.items()
-            if v.get("DeviceType") == "Channel"
-        ]
-        self.snapshot_motors = [
-            k
-            for (k, v) in self.snapshot_metadata.items()
-            if v.get("DeviceType") == "Axis"
-        ]
-        self.snapshot_sensors = [
-            k
-            for (k, v) in self.snapshot_metadata.items()
-            if v.get("DeviceType") == "Channel"
-        ]
+        self.standard_motors, self.standard_sensors = _split_devices(
+            self.standard_metadata
+        )
+        self.snapshot_motors, self.snapshot_sensors = _split_devices(
+            self.snapshot_metadata
+        )
 
         self.preferred_axis = self._name_translation.get(
             self._preferred_axis, self._preferred_axis
@@ -599,6 +691,35 @@ class Chain:
             self._preferred_normalization_channel,
         )
 
+    def _translate_columns(self, columns, typ_trans, meta):
+        """Map raw stddev or averagemeta column names to human-readable names, using the suffixes in typ_trans."""
+        renames = {}
+        for col in columns:
+            cachannel, cachannel_part, canorm_part, typ = _split_column(col)
+            # if cachannel contains '__', the channel is likely normalized and we have to look in meta for the
+            # normalization channel
+            channel = None
+            if canorm_part is not None:
+                try:
+                    channel_part = self._name_translation[cachannel_part]
+                    channel_meta = meta[channel_part]
+                    nid = (
+                        "NormalizeChannelID"
+                        if "NormalizeChannelID" in channel_meta
+                        else "normalizeId"
+                    )
+                    if nid in channel_meta:  # channel is actually normalized
+                        norm_part = self._name_translation[canorm_part]
+                        channel = "/".join((channel_part, norm_part))
+                except KeyError:
+                    pass
+
+            if channel is None:
+                channel = self._name_translation[cachannel]
+
+            renames[col] = channel + typ_trans[typ]
+        return renames
+
     def plot(self, x=None, y=None, **kwargs):
         """Plotting standard data, documentation see pandas.DataFrame.plot, the only difference is that if x and/or
         y are not given, the preferred_axis and preferred_channel are used."""
@@ -622,19 +743,12 @@ class Chain:
         return ax
 
     def __str__(self):
-        ret = "<Chain start: {start}, channels: {channels}".format(
-            start=self.start, channels=list(self.standard_data.columns)
-        )
-        if self.preferred_axis is not None:
-            ret += ", preferred_axis: {!r}".format(self.preferred_axis)
-        if self.preferred_channel is not None:
-            ret += ", preferred_channel: {!r}".format(self.preferred_channel)
-        if self.preferred_normalization_channel is not None:
-            ret += ", preferred_normalization_channel: {!r}".format(
-                self.preferred_normalization_channel
-            )
-        ret += ">"
-        return ret
+        parts = [
+            f"<Chain start: {self.start}, channels: {list(self.standard_data.columns)}"
+        ]
+        parts.extend(_format_preferred(self))
+        parts.append(">")
+        return "".join(parts)
 
 
 class MotorsSensorsScanSensorsMeasurement(EVEMeasurement):
@@ -691,66 +805,82 @@ class MotorsSensorsScanSensorsMeasurement(EVEMeasurement):
 
     def __init__(self, filename, ignore_too_many_snapshots=False):
         EVEMeasurement.__init__(self, filename)
-
+        self._init_standard(ignore_too_many_snapshots)
+
+    @classmethod
+    def from_measurement(cls, measurement, ignore_too_many_snapshots=False):
+        """
+        Create a StandardMeasurement from an already parsed EVEMeasurement, without parsing the file again.
+
+        Raises ValueError like the constructor does, leaving the EVEMeasurement unchanged and usable, hence
+        callers can fall back to it without parsing the file a second time.
+        """
+        self = cls.__new__(cls)
+        self.__dict__.update(measurement.__dict__)
+        self._init_standard(ignore_too_many_snapshots)
+        return self
+
+    def _init_standard(self, ignore_too_many_snapshots):
         if len(self.chains) > 1:
             logging.warning(
                 "Loading {!r} using StandardMeasurement class, but file contains more than one chain. "
                 "Maybe you want to use the more generic EVEMeasurement class?".format(
-                    filename
+                    self.filename
                 )
             )
 
         # put the values right before the measurement in snapshot_before and those right after in snapshot_after.
+        # all columns are handled at once: the running count of data points is 1 from the first data point on and 2
+        # from the second one on, hence its first occurrence gives the row of the respective data point.
+        snapshots = self.snapshot_data.drop(
+            columns="PosCountTimer", errors="ignore"
+        )
+        notna = snapshots.notna().to_numpy()
+        counts = notna.sum(axis=0)
+        invalid = (counts == 0) | (
+            (counts > 2) & (not ignore_too_many_snapshots)
+        )
+        if invalid.any():
+            raise ValueError(
+                "Snapshot of sensor/motor {!r} has {} data points, we expected 1 or 2. Maybe you want"
+                " to use the more generic EVEMeasurement class?".format(
+                    snapshots.columns[invalid.argmax()],
+                    counts[invalid.argmax()],
+                )
+            )
         self.snapshot_before = {}
         self.snapshot_after = {}
-        for col in self.snapshot_data.columns:
-            if col == "PosCountTimer":
-                continue
-            nadropped = self.snapshot_data.loc[:, col].dropna()
-            if len(nadropped) == 1:
-                self.snapshot_before[col] = nadropped.iloc[0]
-            elif len(nadropped) == 2 or (
-                ignore_too_many_snapshots and len(nadropped) > 2
-            ):
-                self.snapshot_before[col] = nadropped.iloc[0]
-                self.snapshot_after[col] = nadropped.iloc[1]
-            else:
-                raise ValueError(
-                    "Snapshot of sensor/motor {!r} has {} data points, we expected 1 or 2. Maybe you want"
-                    " to use the more generic EVEMeasurement class?".format(
-                        col, len(nadropped)
-                    )
-                )
+        if not snapshots.empty:
+            values = snapshots.to_numpy(dtype=object)
+            running_counts = notna.cumsum(axis=0)
+            columns = np.arange(values.shape[1])
+            before = values[(running_counts == 1).argmax(axis=0), columns]
+            after = values[(running_counts == 2).argmax(axis=0), columns]
+            self.snapshot_before = dict(zip(snapshots.columns, before))
+            self.snapshot_after = {
+                col: value
+                for col, value, count in zip(snapshots.columns, after, counts)
+                if count > 1
+            }
 
-        self.data = self.standard_data
-        for motor in self.standard_motors:
-            self.data.loc[:, motor].ffill()  # fillna(method='ffill',
-            # inplace=True)
-        self.data = self.data[~self.data.index.duplicated(keep="first")]
+        # duplicate PosCounters have already been dropped when parsing;
+        # copy to keep standard_data unaffected by filling motor values
+        self.data = self.standard_data.copy()
+        self.data[self.standard_motors] = self.data[
+            self.standard_motors
+        ].ffill()
         self.metadata = self.standard_metadata
 
     def __str__(self):
-        ret = (
-            "<StandardMeasurement file: {filename!r}, comment: {comment}, start: {start}, evedataviewer: {evedataviewer}, "
-            "channels: {channels}".format(
-                filename=self.filename,
-                comment=self.comment,
-                start=self.start,
-                evedataviewer=self.evedataviewer,
-                channels=list(self.data.columns),
-            )
-        )
-        if self.preferred_axis is not None:
-            ret += ", preferred_axis: {!r}".format(self.preferred_axis)
-        if self.preferred_channel is not None:
-            ret += ", preferred_channel: {!r}".format(self.preferred_channel)
-        if self.preferred_normalization_channel is not None:
-            ret += ", preferred_normalization_channel: {!r}".format(
-                self.preferred_normalization_channel
-            )
+        parts = [
+            f"<StandardMeasurement file: {self.filename!r}, comment: {self.comment}, start: {self.start}, "
+            f"evedataviewer: {self.evedataviewer}, channels: {list(self.data.columns)}"
+        ]
+        parts.extend(_format_preferred(self))
         if self.monitor:
-            ret += ", monitor: {}".format(list(self.monitor.keys()))
-        return ret + ">"
+            parts.append(f", monitor: {list(self.monitor.keys())}")
+        parts.append(">")
+        return "".join(parts)
 
 
 StandardMeasurement = MotorsSensorsScanSensorsMeasurement
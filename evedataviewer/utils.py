@@ -5,6 +5,18 @@ Mostly small functions that are more general and get used in the other
 modules.
 """
 
+import collections
+import functools
+import hashlib
+import inspect
+import os
+import pickle  # nosec B403
+import sys
+import tempfile
+import weakref
+
+import evedataviewer
+
 
 def lists_are_equal(list1, list2):
     """
@@ -14,6 +26,10 @@ def lists_are_equal(list1, list2):
     simply use the equal operator ``==``. Furthermore, the two lists are
     not sorted or otherwise altered.
 
+    For hashable items, the comparison is performed using sets and is
+    hence of linear complexity. Otherwise, each item of the first list is
+    looked up in the second list.
+
     Parameters
     ----------
     list1 : :class:`list`
@@ -28,9 +44,397 @@ def lists_are_equal(list1, list2):
         Whether the two lists are equal
 
     """
-    return len(list1) == len(list2) and len(
-        [1 for i in list1 if i in list2]
-    ) == len(list1)
+    if len(list1) != len(list2):
+        return False
+    try:
+        return set(list1).issubset(list2)
+    except TypeError:
+        return all(item in list2 for item in list1)
+
+
+def get_size(obj, seen=None):
+    """
+    Approximate memory footprint of an object including its contents.
+
+    In contrast to :func:`sys.getsizeof`, containers (:class:`dict`,
+    :class:`list`, :class:`tuple`, :class:`set`) as well as the attributes
+    of arbitrary objects, both in their ``__dict__`` and their
+    ``__slots__``, are followed recursively. Each object is only
+    counted once, even if referenced several times. The data buffer of
+    numpy arrays not owning their data (*i.e.*, views) is accounted for as
+    well.
+
+    Based on https://code.activestate.com/recipes/577504/
+
+    Parameters
+    ----------
+    obj
+        Object to determine the size for
+
+    seen : :class:`set`
+        IDs of objects already accounted for
+
+        Only necessary for the recursive calls.
+
+    Returns
+    -------
+    size : :class:`int`
+        Approximate size of the object in bytes
+
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            get_size(key, seen) + get_size(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(get_size(item, seen) for item in obj)
+    elif getattr(obj, "base", None) is not None and hasattr(obj, "nbytes"):
+        size += obj.nbytes
+    if hasattr(obj, "__dict__"):
+        size += get_size(vars(obj), seen)
+    for name in _get_slots(type(obj)):
+        if hasattr(obj, name):
+            size += get_size(getattr(obj, name), seen)
+    return size
+
+
+@functools.lru_cache(maxsize=None)
+def _get_slots(cls):
+    # Names of all slots of a class holding attributes, including inherited
+    slots = []
+    for base in cls.__mro__:
+        names = base.__dict__.get("__slots__", ())
+        if isinstance(names, str):
+            names = (names,)
+        slots.extend(
+            name for name in names if name not in ("__dict__", "__weakref__")
+        )
+    return tuple(slots)
+
+
+class LRUCache(collections.OrderedDict):
+    """
+    Dictionary discarding the least recently used items beyond a threshold.
+
+    Accessing an item by its key marks it as most recently used. Whenever
+    an item is added, the least recently used items are removed until both,
+    the number of items and their (estimated) total size are within the
+    limits set. The size of each item is estimated only once, using
+    :func:`get_size`, when it is added, and the total size is kept track
+    of.
+
+    Iterating over the cache iterates over a copy of its keys. Hence,
+    items can be accessed while iterating, although this marks them as
+    recently used and thus changes the order of the keys.
+
+    Attributes
+    ----------
+    max_items : :class:`int`
+        Maximum number of items to retain
+
+        If ``None``, the number of items is not limited.
+
+    max_bytes : :class:`int`
+        Maximum total size of all items (in bytes) to retain
+
+        If ``None``, the size of the items is not limited.
+
+    pinned : :class:`list`
+        Keys of items that must never be discarded
+
+        If ``None``, all items can be discarded.
+
+    evicted : :class:`dict`-like
+        Mapping additionally receiving all items discarded
+
+        Usually, this will be a :class:`weakref.WeakValueDictionary`,
+        allowing to retrieve discarded items as long as they are still
+        referenced elsewhere. If ``None``, discarded items are dropped.
+
+
+    .. note::
+
+        Items currently pinned are never discarded, even if this means
+        exceeding the limits set.
+
+    """
+
+    def __init__(
+        self, max_items=None, max_bytes=None, pinned=None, evicted=None
+    ):
+        super().__init__()
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.pinned = pinned
+        self.evicted = evicted
+        self._sizes = {}
+        self._size = 0
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._size -= self._sizes.pop(key, 0)
+        if self.max_bytes is not None:
+            self._sizes[key] = get_size(value)
+            self._size += self._sizes[key]
+        self.evict()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._size -= self._sizes.pop(key, 0)
+
+    def __iter__(self):
+        # Iterate over a copy, as accessing items reorders the keys
+        return iter(list(super().__iter__()))
+
+    def pop(self, key, *args):
+        """
+        Remove the item with the given key and return its value.
+
+        Parameters
+        ----------
+        key
+            Key of the item to remove
+
+        default
+            Value returned if the key is not present
+
+            If not given, a :class:`KeyError` is raised in this case.
+
+        Returns
+        -------
+        value
+            Value of the item removed
+
+        """
+        if key not in self:
+            return super().pop(key, *args)
+        value = super().__getitem__(key)
+        del self[key]
+        return value
+
+    def popitem(self, last=True):
+        """
+        Remove an item and return its key and value.
+
+        Parameters
+        ----------
+        last : :class:`bool`
+            Whether to remove the most rather than least recently used item
+
+        Returns
+        -------
+        item : :class:`tuple`
+            Key and value of the item removed
+
+        """
+        key, value = super().popitem(last=last)
+        self._size -= self._sizes.pop(key, 0)
+        return key, value
+
+    def clear(self):
+        """Remove all items."""
+        super().clear()
+        self._sizes.clear()
+        self._size = 0
+
+    @property
+    def size(self):
+        """
+        Estimated total size of all items currently retained.
+
+        Sizes are only estimated if :attr:`max_bytes` is set.
+
+        Returns
+        -------
+        size : :class:`int`
+            Estimated size in bytes
+
+        """
+        return self._size
+
+    def evict(self):
+        """
+        Discard least recently used items until within the limits set.
+
+        Usually, there is no need to call this method directly, as it gets
+        called whenever an item is added.
+        """
+        pinned = set(self.pinned) if self.pinned else set()
+        candidates = [key for key in self if key not in pinned]
+        while candidates and self._exceeds_limits():
+            key = candidates.pop(0)
+            if self.evicted is not None:
+                self.evicted[key] = super().__getitem__(key)
+            del self[key]
+
+    def _exceeds_limits(self):
+        return (
+            self.max_items is not None and len(self) > self.max_items
+        ) or (self.max_bytes is not None and self.size > self.max_bytes)
+
+
+class DiskCache:
+    """
+    Size-limited cache on disk for objects obtained from files.
+
+    Objects are stored using :mod:`pickle`, with the absolute path,
+    modification time, and size of the file they have been obtained from
+    as well as the version of the evedataviewer package as key. Hence,
+    once the file changes or another version of the package is used,
+    the object stored is no longer retrieved. Whenever an object is stored, the objects not accessed for
+    the longest time are removed until the total size of the cache is
+    within the limit set.
+
+    Attributes
+    ----------
+    directory : :class:`str`
+        Directory the objects are stored in
+
+        Default: ``evedataviewer`` in ``$XDG_CACHE_HOME`` or ``~/.cache``
+
+    max_bytes : :class:`int`
+        Maximum total size of all objects stored (in bytes)
+
+        Default: 1 GiB
+
+
+    .. important::
+        As loading pickled data can execute arbitrary code, make sure that
+        nobody else can write to the directory of the cache.
+
+    """
+
+    def __init__(self, directory="", max_bytes=2**30):
+        if not directory:
+            directory = os.path.join(
+                os.environ.get("XDG_CACHE_HOME", os.path.join("~", ".cache")),
+                "evedataviewer",
+            )
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+
+    def load(self, filename=""):
+        """
+        Retrieve the object stored for a file.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            Name of the file the object has been obtained from
+
+        Returns
+        -------
+        obj : :class:`object`
+            Object stored for the file
+
+            ``None`` if no object is stored for the file in its current
+            state, or if the object could not be loaded.
+
+        """
+        path = self._get_path(filename)
+        if not path:
+            return None
+        try:
+            with open(path, "rb") as file:
+                # Only objects stored by save() in a directory the user
+                # has to protect are read, hence they are trusted
+                obj = pickle.load(file)  # nosec B301
+            os.utime(path)
+        except (
+            OSError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            pickle.UnpicklingError,
+        ):
+            return None
+        return obj
+
+    def save(self, filename="", obj=None):
+        """
+        Store the object obtained from a file.
+
+        The object is written to a temporary file first and only then
+        renamed, hence a cache file is never read while being written.
+        Failing to write the cache is silently ignored.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            Name of the file the object has been obtained from
+
+        obj : :class:`object`
+            Object to store
+
+        """
+        path = self._get_path(filename)
+        if not path:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as file:
+                pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, path)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used objects until within the limit set.
+
+        Usually, there is no need to call this method directly, as it gets
+        called whenever an object is stored.
+        """
+        try:
+            entries = [
+                entry
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith(".pkl")
+            ]
+            stats = sorted(
+                ((entry.stat(), entry.path) for entry in entries),
+                key=lambda item: item[0].st_mtime,
+            )
+        except OSError:
+            return
+        size = sum(stat.st_size for stat, _ in stats)
+        for stat, path in stats:
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= stat.st_size
+
+    def _get_path(self, filename):
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return ""
+        path = os.path.abspath(filename)
+        key = (
+            f"{evedataviewer.__version__}:{path}:"
+            f"{stat.st_mtime_ns}:{stat.st_size}"
+        )
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{digest}.pkl")
 
 
 class NotifyingList(list):
@@ -43,23 +447,53 @@ class NotifyingList(list):
 
     Besides that, simply the methods of the superclass :class:`list` are called.
 
+    Parameters
+    ----------
+    iterable
+        Items the list is initialised with
+
+        Initialising the list does not call the callback.
+
+    callback : :py:obj:`function <types.FunctionType>`
+        Function to be called whenever items are added/removed
+
     Attributes
     ----------
     callback : :py:obj:`function <types.FunctionType>`
         Function to be called whenever items are added/removed
 
+        Bound methods are only weakly referenced, hence the list does not
+        keep the object the method belongs to alive. This prevents
+        reference cycles if an object holds a list notifying the object
+        itself.
+
 
     .. note::
 
-        Currently, only :meth:`append` and :meth:`remove` are handled. Add
-        further methods as necessary.
+        All methods of :class:`list` adding, removing or replacing items
+        are handled, but not those only changing the order of the items
+        (:meth:`sort`, :meth:`reverse`).
 
     """
 
-    def __init__(self, callback=None):
-        super().__init__()
+    def __init__(self, iterable=(), callback=None):
+        super().__init__(iterable)
+        self._callback = None
         self.callback = callback
 
+    @property
+    def callback(self):
+        """Function to be called whenever items are added/removed."""
+        if isinstance(self._callback, weakref.WeakMethod):
+            return self._callback()
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback=None):
+        if inspect.ismethod(callback):
+            callback = weakref.WeakMethod(callback)
+        self._callback = callback
+
     def append(self, value):
         """
         Add element to the list
@@ -71,8 +505,36 @@ class NotifyingList(list):
 
         """
         super().append(value)
-        if self.callback:
-            self.callback()
+        self._notify()
+
+    def extend(self, iterable):
+        """
+        Add elements to the end of the list
+
+        Parameters
+        ----------
+        iterable
+            Elements to be added to the list
+
+        """
+        super().extend(iterable)
+        self._notify()
+
+    def insert(self, index, value):
+        """
+        Insert element into the list before the given index
+
+        Parameters
+        ----------
+        index : :class:`int`
+            Index the element should be inserted before
+
+        value
+            Element to be inserted into the list
+
+        """
+        super().insert(index, value)
+        self._notify()
 
     def remove(self, value):
         """
@@ -85,5 +547,47 @@ class NotifyingList(list):
 
         """
         super().remove(value)
+        self._notify()
+
+    def pop(self, index=-1):
+        """
+        Remove element at given index from the list and return it
+
+        Parameters
+        ----------
+        index : :class:`int`
+            Index of the element to be removed
+
+            Default: -1
+
+        Returns
+        -------
+        value
+            Element removed from the list
+
+        """
+        value = super().pop(index)
+        self._notify()
+        return value
+
+    def clear(self):
+        """Remove all elements from the list"""
+        super().clear()
+        self._notify()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._notify()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._notify()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._notify()
+        return result
+
+    def _notify(self):
         if self.callback:
             self.callback()
@@ -14,6 +14,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
             QtWidgets.QApplication.instance() or QtWidgets.QApplication()
         )
         self.widget = dataset_display_widget.DatasetDisplayWidget()
+        self.widget.show()
         self.addCleanup(self.release_qt_resources)
 
     def release_qt_resources(self):
@@ -27,14 +28,49 @@ class TestDatasetDisplayWidget(unittest.TestCase):
     def test_dataset_in_model_appears_in_combobox(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         self.assertEqual(
             os.path.split(dataset_name)[1],
             self.widget._dataset_combobox.itemText(0),
         )
 
+    def test_several_model_changes_update_combobox_once(self):
+        dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
+        updates = []
+        self.widget._update_timer.timeout.connect(lambda: updates.append(1))
+        self.widget.model.datasets_to_display = dataset_names[:1]
+        self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
+        self.assertEqual(1, len(updates))
+        self.assertEqual(2, self.widget._dataset_combobox.count())
+
+    def test_hidden_widget_does_not_update_axes_comboboxes(self):
+        self.widget.hide()
+        self.widget.model.datasets_to_display = ["/foo/bar/bla.blub"]
+        self.app.processEvents()
+        self.assertEqual(0, self.widget._x_axis_combobox.count())
+
+    def test_hidden_widget_keeps_current_dataset_displayed(self):
+        dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
+        self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
+        self.widget.hide()
+        self.widget.model.datasets_to_display = dataset_names[1:]
+        self.app.processEvents()
+        self.assertEqual(dataset_names[1], self.widget.model.current_dataset)
+
+    def test_showing_widget_updates_widget_changed_while_hidden(self):
+        self.widget.hide()
+        self.widget.model.datasets_to_display = ["/foo/bar/bla.blub"]
+        self.app.processEvents()
+        self.widget.show()
+        self.assertEqual(1, self.widget._dataset_combobox.count())
+        self.assertNotEqual(0, self.widget._x_axis_combobox.count())
+
     def test_dataset_in_model_sets_axes_comboboxes(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         axes = self.widget.model.datasets[dataset_name].devices
         self.assertListEqual(
             axes,
@@ -54,6 +90,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
     def test_axes_comboboxes_show_axes_of_selected_dataset(self):
         dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
         self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
         self.widget._dataset_combobox.setCurrentIndex(1)
         axes = self.widget.model.datasets[dataset_names[1]].devices
         self.assertListEqual(
@@ -71,9 +108,20 @@ class TestDatasetDisplayWidget(unittest.TestCase):
             ],
         )
 
+    def test_switching_back_to_dataset_reuses_axes(self):
+        dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
+        self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
+        axes_model = self.widget._x_axis_combobox.model()
+        self.widget._dataset_combobox.setCurrentIndex(1)
+        self.widget._dataset_combobox.setCurrentIndex(0)
+        self.assertIs(axes_model, self.widget._x_axis_combobox.model())
+        self.assertIs(axes_model, self.widget._y_axis_combobox.model())
+
     def test_axes_comboboxes_select_preferred_axes(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         axes = self.widget.model.datasets[dataset_name].preferred_data
         self.assertEqual(
             axes[0],
@@ -88,9 +136,22 @@ class TestDatasetDisplayWidget(unittest.TestCase):
             ),
         )
 
+    def test_subscans_widgets_contain_displayed_buttons(self):
+        self.assertTrue(
+            self.widget._subscan_container.isAncestorOf(
+                self.widget._subscan_decrement_button
+            )
+        )
+        self.assertTrue(
+            self.widget._subscan_container.isAncestorOf(
+                self.widget._subscan_increment_button
+            )
+        )
+
     def test_subscans_widgets_are_disabled_if_dataset_has_no_subscans(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         self.widget.model.datasets[dataset_name].subscans["boundaries"] = []
         for widget in self.widget._subscan_widgets:
             self.assertFalse(widget.isEnabled())
@@ -99,6 +160,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         for widget in self.widget._subscan_widgets:
             self.assertTrue(widget.isEnabled())
 
@@ -106,7 +168,9 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_names = ["/foo/bar/bla.blub", "/foo/bar/__init__.blub"]
         self.widget.model.datasets_to_display = [dataset_names[0]]
+        self.app.processEvents()
         self.widget.model.datasets_to_display = [dataset_names[1]]
+        self.app.processEvents()
         for widget in self.widget._subscan_widgets:
             self.assertTrue(widget.isEnabled())
 
@@ -114,6 +178,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         n_subscans = len(
             self.widget.model.datasets[dataset_name].subscans["boundaries"]
         )
@@ -128,13 +193,16 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_names = ["/foo/bar/__init__.blub", "/foo/bar/bla.blub"]
         self.widget.model.datasets_to_display = [dataset_names[0]]
+        self.app.processEvents()
         self.widget.model.datasets_to_display = [dataset_names[1]]
+        self.app.processEvents()
         self.assertEqual("0", self.widget._subscan_number_label.text())
 
     def test_subscans_edit_validator_has_correct_upper_limit(self):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         n_subscans = len(
             self.widget.model.datasets[dataset_name].subscans["boundaries"]
         )
@@ -147,6 +215,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         n_subscans = len(
             self.widget.model.datasets[dataset_name].subscans["boundaries"]
         )
@@ -162,6 +231,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         qtbricks.testing.qtest_enter_text(
             widget=self.widget._subscan_current_edit, text="1"
         )
@@ -175,12 +245,14 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         self.assertFalse(self.widget._subscan_decrement_button.isEnabled())
 
     def test_subscan_increment_button_disabled_when_subscans_max(self):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         n_subscans = len(
             self.widget.model.datasets[dataset_name].subscans["boundaries"]
         )
@@ -194,6 +266,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         QtTest.QTest.mouseClick(
             self.widget._subscan_increment_button,
             QtCore.Qt.MouseButton.LeftButton,
@@ -208,6 +281,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         QtTest.QTest.mouseClick(
             self.widget._subscan_increment_button,
             QtCore.Qt.MouseButton.LeftButton,
@@ -221,6 +295,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         n_subscans = len(
             self.widget.model.datasets[dataset_name].subscans["boundaries"]
         )
@@ -241,6 +316,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         # Convention from DummyImporter: __init__ in filename creates subscans
         dataset_name = "/foo/bar/__init__.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         n_subscans = len(
             self.widget.model.datasets[dataset_name].subscans["boundaries"]
         )
@@ -260,14 +336,22 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         self.widget.model = model.Model()
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         self.assertEqual(
             os.path.split(dataset_name)[1],
             self.widget._dataset_combobox.itemText(0),
         )
 
+    def test_changing_model_disconnects_previous_model(self):
+        previous_model = self.widget.model
+        self.widget.model = model.Model()
+        previous_model.dataset_selection_changed.emit([])
+        self.assertFalse(self.widget._update_timer.isActive())
+
     def test_changing_x_axis_combobox_sets_preferred_axis_in_dataset(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         axes = self.widget.model.datasets[dataset_name].devices
         self.widget._x_axis_combobox.setCurrentIndex(1)
         self.assertEqual(
@@ -278,6 +362,7 @@ class TestDatasetDisplayWidget(unittest.TestCase):
     def test_changing_y_axis_combobox_sets_preferred_axis_in_dataset(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         axes = self.widget.model.datasets[dataset_name].devices
         self.widget._y_axis_combobox.setCurrentIndex(1)
         self.assertEqual(
@@ -285,6 +370,24 @@ class TestDatasetDisplayWidget(unittest.TestCase):
             axes[1],
         )
 
+    def test_updating_axes_comboboxes_does_not_change_dataset(self):
+        dataset_name = "/foo/bar/bla.blub"
+        self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
+        changed = []
+        self.widget.model.dataset_changed.connect(changed.append)
+        self.widget._update_axes_comboboxes()
+        self.assertFalse(changed)
+
+    def test_selecting_preferred_axes_again_does_not_change_dataset(self):
+        dataset_name = "/foo/bar/bla.blub"
+        self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
+        changed = []
+        self.widget.model.dataset_changed.connect(changed.append)
+        self.widget._set_dataset_preferred_data()
+        self.assertFalse(changed)
+
     def test_changing_x_axis_scale_combobox_sets_axis_scale(self):
         fig, ax = plt.subplots()
         self.widget.model.figure = fig
@@ -306,25 +409,62 @@ class TestDatasetDisplayWidget(unittest.TestCase):
     def test_deselecting_any_dataset_clears_x_axis_combobox(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         self.assertTrue(self.widget._x_axis_combobox.currentText())
         self.widget.model.datasets_to_display = []
+        self.app.processEvents()
         self.assertFalse(self.widget._x_axis_combobox.currentText())
 
     def test_deselecting_any_dataset_clears_y_axis_combobox(self):
         dataset_name = "/foo/bar/bla.blub"
         self.widget.model.datasets_to_display = [dataset_name]
+        self.app.processEvents()
         self.assertTrue(self.widget._y_axis_combobox.currentText())
         self.widget.model.datasets_to_display = []
+        self.app.processEvents()
         self.assertFalse(self.widget._y_axis_combobox.currentText())
 
     def test_changing_dataset_selection_updates_model(self):
         dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
         self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
+        self.widget._dataset_combobox.setCurrentIndex(1)
+        self.assertEqual(dataset_names[1], self.widget.model.current_dataset)
+
+    def test_adding_dataset_retains_selected_dataset(self):
+        dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
+        self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
         self.widget._dataset_combobox.setCurrentIndex(1)
+        self.widget.model.datasets_to_display = [
+            "/foo/bar/baz.blub",
+            *dataset_names,
+        ]
+        self.app.processEvents()
+        self.assertEqual(
+            "foobar.blub", self.widget._dataset_combobox.currentText()
+        )
         self.assertEqual(dataset_names[1], self.widget.model.current_dataset)
 
+    def test_removing_selected_dataset_updates_model(self):
+        dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
+        self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
+        self.widget._dataset_combobox.setCurrentIndex(1)
+        self.widget.model.datasets_to_display = dataset_names[:1]
+        self.app.processEvents()
+        self.assertEqual(
+            ["bla.blub"],
+            [
+                self.widget._dataset_combobox.itemText(idx)
+                for idx in range(self.widget._dataset_combobox.count())
+            ],
+        )
+        self.assertEqual(dataset_names[0], self.widget.model.current_dataset)
+
     def test_clearing_dataset_selection_updates_model(self):
         dataset_names = ["/foo/bar/bla.blub", "/foo/bar/foobar.blub"]
         self.widget.model.datasets_to_display = dataset_names
+        self.app.processEvents()
         self.widget._dataset_combobox.setCurrentIndex(-1)
         self.assertEqual("", self.widget.model.current_dataset)
@@ -20,3 +20,6 @@ class TestMainWindow(unittest.TestCase):
 
     def test_instantiate_class(self):
         pass
+
+    def test_disk_cache_is_disabled_by_default(self):
+        self.assertIsNone(self.widget.model.disk_cache)
@@ -1,4 +1,5 @@
 import unittest
+import weakref
 
 from PySide6 import QtCore, QtWidgets
 
@@ -89,3 +90,26 @@ class TestMeasurementCharacteristicsWidget(unittest.TestCase):
         self.widget.model.datasets_to_display = [dataset_name]
         self.widget.model.current_dataset = ""
         self.assertFalse(self.widget._location_value_label.text())
+
+    def test_selecting_same_dataset_again_does_not_update_labels(self):
+        dataset_name = "/foo/bar/bla.blub"
+        self.widget.model.datasets_to_display = [dataset_name]
+        self.widget._location_value_label.setText("foo")
+        self.widget.model.current_dataset_changed.emit(dataset_name)
+        self.assertEqual("foo", self.widget._location_value_label.text())
+
+    def test_displayed_dataset_is_not_kept_alive(self):
+        dataset_name = "/foo/bar/bla.blub"
+        self.widget.model.datasets_to_display = [dataset_name]
+        reference = weakref.ref(self.widget.model.datasets[dataset_name])
+        self.widget.model.datasets.clear()
+        self.widget.model._weak_datasets.clear()
+        self.assertIsNone(reference())
+
+    def test_deselecting_evicted_dataset_clears_location(self):
+        dataset_name = "/foo/bar/bla.blub"
+        self.widget.model.datasets_to_display = [dataset_name]
+        self.widget.model.datasets.clear()
+        self.widget.model._weak_datasets.clear()
+        self.widget.model.current_dataset = ""
+        self.assertFalse(self.widget._location_value_label.text())
@@ -1,6 +1,10 @@
+import contextlib
+import io
 import unittest
 
 import matplotlib.pyplot as plt
+import numpy as np
+from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import QApplication
 
 import evedataviewer.dataset
@@ -92,6 +96,7 @@ class TestCaseUsingQSignals(unittest.TestCase):
 
 class TestModel(unittest.TestCase):
     def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
         self.model = gui_model.Model()
 
     def test_instantiate_class(self):
@@ -120,6 +125,11 @@ class TestModel(unittest.TestCase):
         self.model.datasets_to_display.append(dataset)
         self.assertIn(dataset, self.model.datasets)
 
+    def test_appending_dataset_after_setting_datasets_loads_dataset(self):
+        self.model.datasets_to_display = ["foo"]
+        self.model.datasets_to_display.append("bar")
+        self.assertIn("bar", self.model.datasets)
+
     def test_removing_dataset_from_datasets_to_display_keeps_dataset(self):
         dataset = "foo"
         self.model.datasets_to_display.append(dataset)
@@ -127,6 +137,125 @@ class TestModel(unittest.TestCase):
         self.assertIn(dataset, self.model.datasets)
         self.assertNotIn(dataset, self.model.datasets_to_display)
 
+    def test_display_labels_contain_labels_of_datasets_to_display(self):
+        self.model.datasets_to_display = ["foo", "bar"]
+        self.assertListEqual(
+            [
+                self.model.datasets["foo"].label,
+                self.model.datasets["bar"].label,
+            ],
+            self.model.display_labels,
+        )
+
+    def test_display_labels_reflect_appended_dataset(self):
+        self.model.datasets_to_display = ["foo"]
+        _ = self.model.display_labels
+        self.model.datasets_to_display.append("bar")
+        self.assertEqual(2, len(self.model.display_labels))
+
+    def test_display_labels_reflect_changed_dataset(self):
+        self.model.datasets_to_display = ["foo"]
+        _ = self.model.display_labels
+        self.model.datasets["foo"].label = "bar"
+        self.model.dataset_changed.emit("foo")
+        self.assertListEqual(["bar"], self.model.display_labels)
+
+    def test_datasets_exceeding_cache_size_get_discarded(self):
+        self.model = gui_model.Model(max_cache_bytes=1)
+        self.model.datasets_to_display = ["foo"]
+        self.model.datasets_to_display = ["bar"]
+        self.assertNotIn("foo", self.model.datasets)
+
+    def test_discarded_datasets_still_referenced_are_reused(self):
+        self.model = gui_model.Model(max_cache_bytes=1)
+        self.model.datasets_to_display = ["foo"]
+        dataset = self.model.datasets["foo"]
+        self.model.datasets_to_display = ["bar"]
+        self.model.datasets_to_display = ["foo"]
+        self.assertIs(dataset, self.model.datasets["foo"])
+
+    def test_load_data_stores_dataset_in_disk_cache(self):
+        class MockDiskCache:
+            def __init__(self):
+                self.objects = {}
+
+            def load(self, filename=""):
+                return self.objects.get(filename)
+
+            def save(self, filename="", obj=None):
+                self.objects[filename] = obj
+
+        self.model.disk_cache = MockDiskCache()
+        self.model.load_data(filename="foo")
+        self.assertIs(
+            self.model.datasets["foo"], self.model.disk_cache.objects["foo"]
+        )
+
+    def test_datasets_to_display_are_not_discarded(self):
+        self.model = gui_model.Model(max_cache_bytes=1)
+        self.model.datasets_to_display = ["foo", "bar"]
+        for dataset in ["foo", "bar"]:
+            self.assertIn(dataset, self.model.datasets)
+
+    def test_loading_asynchronously_loads_datasets(self):
+        self.model.load_asynchronously = True
+        self.model.datasets_to_display = ["foo", "bar"]
+        QThreadPool.globalInstance().waitForDone()
+        self.app.processEvents()
+        for dataset in ["foo", "bar"]:
+            self.assertIn(dataset, self.model.datasets)
+
+    def test_loading_asynchronously_displays_data_once_loaded(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.load_asynchronously = True
+        self.model.datasets_to_display = ["foo"]
+        QThreadPool.globalInstance().waitForDone()
+        self.app.processEvents()
+        self.app.processEvents()
+        self.assertTrue(ax.has_data())
+
+    def test_failing_asynchronous_load_discards_dataset(self):
+        fig, ax = plt.subplots()
+        self.addCleanup(plt.close, fig)
+        self.model.figure = fig
+        self.model.load_asynchronously = True
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.model.datasets_to_display = ["foo", "/nonexistent/file.h5"]
+            QThreadPool.globalInstance().waitForDone()
+        self.app.processEvents()
+        self.app.processEvents()
+        self.assertFalse(self.model._loading)
+        self.assertNotIn("/nonexistent/file.h5", self.model.datasets)
+        self.assertListEqual(["foo"], self.model.datasets_to_display)
+        self.assertTrue(ax.has_data())
+
+    def test_prefetch_neighbours_loads_adjacent_datasets(self):
+        self.model.load_asynchronously = True
+        files = ["foo", "bar", "baz", "bla"]
+        self.model.prefetch_neighbours(current="bar", all_files=files)
+        QThreadPool.globalInstance().waitForDone()
+        self.app.processEvents()
+        self.assertListEqual(
+            ["foo", "bar", "baz"],
+            sorted(self.model.datasets, key=files.index),
+        )
+
+    def test_prefetch_neighbours_requires_asynchronous_loading(self):
+        self.model.prefetch_neighbours(
+            current="bar", all_files=["foo", "bar"]
+        )
+        self.assertFalse(self.model.datasets)
+
+    def test_prefetch_neighbours_respects_cache_size(self):
+        self.model = gui_model.Model(max_cache_bytes=1)
+        self.model.datasets_to_display = ["foo"]
+        self.model.load_asynchronously = True
+        self.model.prefetch_neighbours(
+            current="foo", all_files=["foo", "bar"]
+        )
+        self.assertFalse(self.model._loading)
+
     def test_load_data_adds_dataset(self):
         dataset = "foo"
         self.model.load_data(filename=dataset)
@@ -148,14 +277,150 @@ class TestModel(unittest.TestCase):
         self.model.plot_data()
         self.assertEqual(1, len(ax.get_lines()))
 
+    def test_plot_data_keeps_lines_of_datasets_already_plotted(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display = ["foo"]
+        self.model.plot_data()
+        line = ax.get_lines()[0]
+        self.model.datasets_to_display = ["foo", "bar"]
+        self.model.plot_data()
+        self.assertEqual(2, len(ax.get_lines()))
+        self.assertIn(line, ax.get_lines())
+
+    def test_plot_data_removes_lines_of_datasets_not_displayed(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display = ["foo", "bar"]
+        self.model.plot_data()
+        self.model.datasets_to_display = ["bar"]
+        self.model.plot_data()
+        self.assertEqual(1, len(ax.get_lines()))
+
+    def test_changed_dataset_gets_replotted(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display = ["foo"]
+        self.model.plot_data()
+        line = ax.get_lines()[0]
+        dataset = self.model.datasets["foo"]
+        dataset.preferred_data = list(reversed(dataset.preferred_data))
+        self.model.dataset_changed.emit("foo")
+        self.model.plot_data()
+        self.assertEqual(1, len(ax.get_lines()))
+        np.testing.assert_array_equal(
+            dataset.subscan.data, ax.get_lines()[0].get_ydata()
+        )
+
+    def test_changed_dataset_updates_its_line(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display = ["foo"]
+        self.model.plot_data()
+        line = ax.get_lines()[0]
+        dataset = self.model.datasets["foo"]
+        dataset.preferred_data = list(reversed(dataset.preferred_data))
+        self.model.dataset_changed.emit("foo")
+        self.model.plot_data()
+        self.assertIs(line, ax.get_lines()[0])
+
+    def test_changed_dataset_no_longer_displayed_gets_removed(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display = ["foo", "bar"]
+        self.model.plot_data()
+        dataset = self.model.datasets["foo"]
+        dataset.preferred_data = list(reversed(dataset.preferred_data))
+        self.model.dataset_changed.emit("foo")
+        self.model.datasets_to_display = ["bar"]
+        self.model.plot_data()
+        self.assertEqual(1, len(ax.get_lines()))
+
+    def test_unchanged_dataset_does_not_get_replotted(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display = ["foo"]
+        self.model.plot_data()
+        line = ax.get_lines()[0]
+        self.model.dataset_changed.emit("foo")
+        self.model.plot_data()
+        self.assertIn(line, ax.get_lines())
+
+    def test_plot_data_with_unchanged_datasets_does_not_redraw(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display = ["foo"]
+        self.model.plot_data()
+        redraws = []
+        self.model._redraw = lambda: redraws.append(True)
+        self.model.plot_data()
+        self.assertFalse(redraws)
+
+    def test_plot_changed_refreshes_plot_in_event_loop(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        draws = []
+        fig.canvas.mpl_connect("draw_event", draws.append)
+        self.model.plot_changed.emit()
+        self.assertFalse(draws)
+        # Refresh is queued, and the canvas defers drawing once more
+        self.app.processEvents()
+        self.app.processEvents()
+        self.assertTrue(draws)
+
+    def test_set_current_dataset_to_appended_dataset(self):
+        self.model.datasets_to_display = ["foo"]
+        self.model.datasets_to_display.append("bar")
+        self.model.current_dataset = "bar"
+        self.assertEqual("bar", self.model.current_dataset)
+
     def test_appending_dataset_displays_dataset(self):
         dataset = "foo"
         fig, ax = plt.subplots()
         self.model.figure = fig
         self.assertFalse(ax.has_data())
         self.model.datasets_to_display.append(dataset)
+        self.app.processEvents()
         self.assertTrue(ax.has_data())
 
+    def test_display_is_deferred_until_event_loop_runs(self):
+        fig, ax = plt.subplots()
+        self.model.figure = fig
+        self.model.datasets_to_display.append("foo")
+        self.assertFalse(ax.has_data())
+
+    def test_multiple_changes_display_data_only_once(self):
+        class MockModel(gui_model.Model):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def print_data(self):
+                self.calls += 1
+
+        mock = MockModel()
+        mock._display_mode = "print"
+        mock.datasets_to_display.append("foo")
+        mock.datasets_to_display.append("bar")
+        mock.datasets_to_display.remove("foo")
+        self.app.processEvents()
+        self.assertEqual(1, mock.calls)
+
+    def test_set_datasets_to_display_displays_data_once(self):
+        class MockModel(gui_model.Model):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def print_data(self):
+                self.calls += 1
+
+        mock = MockModel()
+        mock._display_mode = "print"
+        mock.datasets_to_display = ["foo", "bar"]
+        self.app.processEvents()
+        self.assertEqual(1, mock.calls)
+
     def test_alternative_display_mode_calls_respective_method(self):
         class MockModel(gui_model.Model):
             def __init__(self):
@@ -168,6 +433,7 @@ class TestModel(unittest.TestCase):
         mock = MockModel()
         mock._display_mode = "print"
         mock.display_data()
+        self.app.processEvents()
         self.assertTrue(mock.method_called)
 
     def test_set_datasets_to_display_to_identical_list_doesnt_plot(self):
@@ -222,6 +488,21 @@ class TestModelSignals(TestCaseUsingQSignals):
         ):
             self.model.datasets_to_display = datasets
 
+    def test_setting_identical_datasets_doesnt_emit_signal(self):
+        self.model.datasets_to_display = ["foo.bla", "bar.blub"]
+        with self.assertSignalNotReceived(
+            self.model.dataset_selection_changed
+        ):
+            self.model.datasets_to_display = self.model.datasets_to_display
+
+    def test_setting_reordered_datasets_emits_signal(self):
+        self.model.datasets_to_display = ["foo.bla", "bar.blub"]
+        datasets = ["bar.blub", "foo.bla"]
+        with self.assertSignalReceived(
+            self.model.dataset_selection_changed, datasets
+        ):
+            self.model.datasets_to_display = datasets
+
     def test_dataset_changed_signal_can_be_emitted(self):
         with self.assertSignalReceived(self.model.dataset_changed, ""):
             self.model.dataset_changed.emit([])
@@ -234,6 +515,65 @@ class TestModelSignals(TestCaseUsingQSignals):
         ):
             self.model.current_dataset = datasets[1]
 
+    def test_batch_updates_defers_signals_until_leaving_context(self):
+        datasets = ["foo.bla", "bar.blub"]
+        receiver = SignalNotReceiver(
+            self, self.model.dataset_selection_changed
+        )
+        receiver.signal.connect(receiver.slot)
+        with self.model.batch_updates():
+            self.model.datasets_to_display = datasets
+            self.assertFalse(receiver.called)
+        self.assertTrue(receiver.called)
+
+    def test_batch_updates_emits_signals_when_leaving_context(self):
+        datasets = ["foo.bla", "bar.blub"]
+        with self.assertSignalReceived(
+            self.model.dataset_selection_changed, datasets
+        ):
+            with self.model.batch_updates():
+                self.model.datasets_to_display = datasets
+
+    def test_nested_batch_updates_emit_when_leaving_outer_context(self):
+        datasets = ["foo.bla", "bar.blub"]
+        receiver = SignalReceiver(
+            self, self.model.current_dataset_changed, datasets[1]
+        )
+        with receiver:
+            with self.model.batch_updates():
+                self.model.datasets_to_display = datasets
+                with self.model.batch_updates():
+                    self.model.current_dataset = datasets[1]
+                self.assertFalse(receiver.called)
+
+    def test_batch_updates_loads_data_when_leaving_context(self):
+        with self.model.batch_updates():
+            self.model.datasets_to_display.append("foo")
+            self.assertNotIn("foo", self.model.datasets)
+        self.assertIn("foo", self.model.datasets)
+
+    def test_loading_asynchronously_defers_signal_until_loaded(self):
+        datasets = ["foo.bla", "bar.blub"]
+        self.model.load_asynchronously = True
+        receiver = SignalReceiver(
+            self, self.model.dataset_selection_changed, datasets
+        )
+        with receiver:
+            self.model.datasets_to_display = datasets
+            self.assertFalse(receiver.called)
+            QThreadPool.globalInstance().waitForDone()
+            self.app.processEvents()
+
+    def test_failing_asynchronous_load_emits_deferred_signal(self):
+        self.model.load_asynchronously = True
+        receiver = SignalReceiver(
+            self, self.model.current_dataset_changed, "foo"
+        )
+        with receiver, contextlib.redirect_stderr(io.StringIO()):
+            self.model.datasets_to_display = ["/nonexistent/file.h5", "foo"]
+            QThreadPool.globalInstance().waitForDone()
+            self.app.processEvents()
+
     def test_setting_current_dataset_identical_doesnt_emit_signal(self):
         datasets = ["foo.bla", "bar.blub"]
         self.model.datasets_to_display = datasets
@@ -123,6 +123,38 @@ class TestDataset(unittest.TestCase):
         _ = self.dataset.subscan
         self.assertEqual(len(self.dataset.data.data), length)
 
+    def test_subscan_reflects_replaced_boundaries(self):
+        self.dataset.data.data = np.linspace(1, 10, 10)
+        self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
+        self.dataset.subscans["boundaries"] = [[0, 5], [5, 10]]
+        self.dataset.subscans["current"] = 1
+        _ = self.dataset.subscan
+        self.dataset.subscans["boundaries"] = [[0, 2], [2, 10]]
+        np.testing.assert_array_equal(
+            self.dataset.data.data[2:10], self.dataset.subscan.data
+        )
+
+    def test_subscan_reflects_boundaries_changed_in_place(self):
+        self.dataset.data.data = np.linspace(1, 10, 10)
+        self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
+        self.dataset.subscans["boundaries"] = [[0, 5], [5, 10]]
+        self.dataset.subscans["current"] = 1
+        _ = self.dataset.subscan
+        self.dataset.subscans["boundaries"][1][0] = 7
+        self.dataset.subscans["boundaries"].append([10, 10])
+        np.testing.assert_array_equal(
+            self.dataset.data.data[7:10], self.dataset.subscan.data
+        )
+
+    def test_subscan_values_cannot_be_modified_in_place(self):
+        self.dataset.data.data = np.zeros(10)
+        self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
+        self.dataset.subscans["boundaries"] = [[0, 5], [5, 10]]
+        self.dataset.subscans["current"] = 0
+        with self.assertRaises(ValueError):
+            self.dataset.subscan.data[0] = 1
+        self.assertFalse(self.dataset.data.data.any())
+
     def test_subscan_with_current_subscan_set_to_minus_one_returns_data(self):
         self.dataset.data.data = np.zeros(10)
         self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
@@ -138,6 +170,12 @@ class TestDataset(unittest.TestCase):
             self.dataset.data.axes[0].values,
         )
 
+    def test_subscan_with_current_subscan_set_to_minus_one_is_data(self):
+        self.dataset.data.data = np.zeros(10)
+        self.dataset.subscans["boundaries"] = [[0, 5], [5, 10]]
+        self.dataset.subscans["current"] = -1
+        self.assertIs(self.dataset.data, self.dataset.subscan)
+
     def test_plot_plots_data(self):
         self.dataset.data.data = np.zeros(10)
         self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
@@ -161,12 +199,75 @@ class TestDataset(unittest.TestCase):
             data.data,
         )
 
+    def test_plot_with_artists_updates_artists(self):
+        self.dataset.data.data = np.zeros(10)
+        self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
+        fig, ax = plt.subplots()
+        artists = self.dataset.plot(figure=fig)
+        self.dataset.data.data = np.ones(10)
+        self.assertIs(artists, self.dataset.plot(figure=fig, artists=artists))
+        self.assertEqual(1, len(ax.lines))
+        np.testing.assert_allclose(
+            ax.lines[0].get_ydata(),
+            self.dataset.data.data,
+        )
+
+    def test_plot_sets_axis_labels(self):
+        self.dataset.data.data = np.zeros(10)
+        self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
+        self.dataset.data.axes[0].quantity = "position"
+        self.dataset.data.axes[1].quantity = "intensity"
+        fig, ax = plt.subplots()
+        self.dataset.plot(figure=fig)
+        self.assertEqual("position", ax.get_xlabel())
+        self.assertEqual("intensity", ax.get_ylabel())
+
+    def test_plot_with_unchanged_labels_does_not_set_labels(self):
+        self.dataset.data.data = np.zeros(10)
+        self.dataset.data.axes[0].values = np.linspace(1, 10, 10)
+        self.dataset.data.axes[0].quantity = "position"
+        self.dataset.data.axes[1].quantity = "intensity"
+        fig, ax = plt.subplots()
+        artists = self.dataset.plot(figure=fig)
+        labels = []
+        ax.set_xlabel = labels.append
+        ax.set_ylabel = labels.append
+        self.dataset.plot(figure=fig, artists=artists)
+        self.assertFalse(labels)
+
     def test_metadata_is_metadata_object(self):
         self.assertIsInstance(
             self.dataset.metadata, eve_dataset.DatasetMetadata
         )
 
 
+class TestAxis(unittest.TestCase):
+    def setUp(self):
+        self.axis = eve_dataset.Axis()
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_label_without_unit_is_quantity(self):
+        self.axis.quantity = "energy"
+        self.assertEqual("energy", self.axis.label)
+
+    def test_label_separates_quantity_and_unit_with_slash(self):
+        self.axis.quantity = "energy"
+        self.axis.unit = "eV"
+        self.assertEqual("energy / eV", self.axis.label)
+
+    def test_label_reflects_changed_unit(self):
+        self.axis.quantity = "energy"
+        self.axis.unit = "eV"
+        self.axis.unit = ""
+        self.assertEqual("energy", self.axis.label)
+
+    def test_label_reflects_quantity_and_unit_set_on_instantiation(self):
+        axis = eve_dataset.Axis(quantity="energy", unit="eV")
+        self.assertEqual("energy / eV", axis.label)
+
+
 class TestDatasetMetadata(unittest.TestCase):
     def setUp(self):
         self.dataset_metadata = eve_dataset.DatasetMetadata()
@@ -1,11 +1,51 @@
 import datetime
 import os.path
+import tempfile
 import unittest
 
 from evedataviewer import io as eve_io
 from evedataviewer import dataset as eve_dataset
 
 
+class TestReportProblematicFile(unittest.TestCase):
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.original_home = os.environ.get("HOME")
+        os.environ["HOME"] = self.home.name
+        self.logfile = os.path.join(
+            self.home.name, ".paradise_problematic_files"
+        )
+        self.filename = os.path.join(self.home.name, "foo.h5")
+
+    def tearDown(self):
+        if self.original_home is None:
+            del os.environ["HOME"]
+        else:
+            os.environ["HOME"] = self.original_home
+        eve_io._REPORTED_FILES.discard(self.filename)
+        self.home.cleanup()
+
+    def test_report_appends_filename_to_logfile(self):
+        eve_io.report_problematic_file(filename=self.filename)
+        with open(self.logfile, encoding="utf-8") as file:
+            self.assertEqual(f"{self.filename}\n", file.read())
+
+    def test_report_same_file_twice_appends_filename_once(self):
+        eve_io.report_problematic_file(filename=self.filename)
+        eve_io.report_problematic_file(filename=self.filename)
+        with open(self.logfile, encoding="utf-8") as file:
+            self.assertEqual(f"{self.filename}\n", file.read())
+
+    def test_report_after_failed_write_appends_filename(self):
+        os.mkdir(self.logfile)
+        with self.assertRaises(OSError):
+            eve_io.report_problematic_file(filename=self.filename)
+        os.rmdir(self.logfile)
+        eve_io.report_problematic_file(filename=self.filename)
+        with open(self.logfile, encoding="utf-8") as file:
+            self.assertEqual(f"{self.filename}\n", file.read())
+
+
 class TestImporterFactory(unittest.TestCase):
     def setUp(self):
         self.factory = eve_io.ImporterFactory()
@@ -21,6 +61,10 @@ class TestImporterFactory(unittest.TestCase):
         importer = self.factory.get_importer(source="foo.h5")
         self.assertIsInstance(importer, eve_io.EveHDF5Importer)
 
+    def test_get_importer_sets_source(self):
+        importer = self.factory.get_importer(source="foo.h5")
+        self.assertEqual("foo.h5", importer.source)
+
 
 class TestImporter(unittest.TestCase):
     def setUp(self):
@@ -83,6 +127,10 @@ class TestDummyImporter(unittest.TestCase):
         self.importer.import_into(self.dataset)
         self.assertEqual(-1, self.dataset.subscans["current"])
 
+    def test_shared_axis_values_are_read_only(self):
+        self.importer.import_into(self.dataset)
+        self.assertFalse(self.dataset.data.axes[0].values.flags.writeable)
+
 
 class TestEveHDF5Importer(unittest.TestCase):
     path_to_testdata = "/messung/sx700/daten/2023/KW44_23/PTB/00003.h5"
@@ -0,0 +1,322 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+import h5py
+import numpy as np
+import pandas as pd
+
+from evedataviewer import paradise
+
+
+def _attribute(value=""):
+    return np.array([value.encode("latin-1")])
+
+
+def _create_leaf(group=None, name="", fields=None, rows=None, attrs=None):
+    dataset = group.create_dataset(name, data=np.array(rows, dtype=fields))
+    dataset.attrs.update(
+        {key: _attribute(value) for key, value in (attrs or {}).items()}
+    )
+
+
+def _create_device(group=None, name="", device_type="", rows=None):
+    _create_leaf(
+        group,
+        name,
+        fields=[("PosCounter", "i4"), (name, "f8")],
+        rows=rows,
+        attrs={
+            "XML-ID": name,
+            "Name": name.capitalize(),
+            "DeviceType": device_type,
+            "Unit": "mm",
+        },
+    )
+
+
+def _create_measurement(filename="", snapshots=((0, -1.0),)):
+    with h5py.File(filename, "w") as file:
+        file.attrs.update(
+            {
+                "EVEH5Version": _attribute("2.0"),
+                "Version": _attribute("1.3"),
+                "StartDate": _attribute("01.02.2020"),
+                "StartTime": _attribute("10:00:00"),
+            }
+        )
+        chain = file.create_group("c1")
+        chain.attrs.update(
+            {
+                "preferredAxis": _attribute("motor"),
+                "preferredChannel": _attribute("detector"),
+            }
+        )
+        main = chain.create_group("main")
+        _create_device(main, "motor", "Axis", [(1, 0.0), (2, 1.0)])
+        _create_device(main, "detector", "Channel", [(1, 5.0), (3, 6.0)])
+        snapshot = chain.create_group("snapshot")
+        _create_device(snapshot, "motor", "Axis", list(snapshots))
+
+
+class TestParseEveHdf5(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "foo.h5")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _create_leaves(self, leaves=None):
+        with h5py.File(self.filename, "w") as file:
+            group = file.create_group("group")
+            for name, (dtype, rows) in leaves.items():
+                _create_leaf(
+                    group,
+                    name,
+                    fields=[("PosCounter", "i4"), (name, dtype)],
+                    rows=rows,
+                )
+
+    def _create_array_channel(self, arrays=None):
+        with h5py.File(self.filename, "w") as file:
+            channel = file.create_group("group").create_group("channel")
+            channel.attrs["XML-ID"] = _attribute("channel")
+            for pos_counter, array in arrays.items():
+                channel.create_dataset(str(pos_counter), data=array)
+
+    def _parse_group(self):
+        return paradise.parse_eve_hdf5(self.filename)["children"]["group"]
+
+    def test_leaves_are_joined_on_pos_counter(self):
+        self._create_leaves(
+            {
+                "foo": ("f8", [(1, 1.0), (2, 2.0), (3, 3.0)]),
+                "bar": ("f8", [(1, 4.0), (2, 5.0), (3, 6.0)]),
+            }
+        )
+        data = self._parse_group()["data"]
+        self.assertEqual("PosCounter", data.index.name)
+        self.assertListEqual([1, 2, 3], list(data.index))
+        self.assertCountEqual(["foo", "bar"], data.columns)
+        self.assertListEqual([4.0, 5.0, 6.0], list(data["bar"]))
+
+    def test_leaves_with_different_pos_counters_are_joined(self):
+        for name, rows in {
+            "sorted": [(1, 1.0), (3, 3.0)],
+            "unsorted": [(3, 3.0), (1, 1.0)],
+        }.items():
+            with self.subTest(leaf=name):
+                self._create_leaves(
+                    {
+                        "foo": ("f8", rows),
+                        "bar": ("f8", [(1, 4.0), (2, 5.0)]),
+                    }
+                )
+                data = self._parse_group()["data"]
+                self.assertListEqual([1, 2, 3], list(data.index))
+                np.testing.assert_array_equal([1.0, np.nan, 3.0], data["foo"])
+                np.testing.assert_array_equal([4.0, 5.0, np.nan], data["bar"])
+
+    def test_duplicate_pos_counters_keep_first_row(self):
+        self._create_leaves(
+            {
+                "foo": ("f8", [(1, 1.0), (2, 2.0), (2, 3.0)]),
+                "bar": ("f8", [(1, 4.0), (2, 5.0)]),
+            }
+        )
+        data = self._parse_group()["data"]
+        self.assertListEqual([1, 2], list(data.index))
+        self.assertListEqual([1.0, 2.0], list(data["foo"]))
+        self.assertListEqual([4.0, 5.0], list(data["bar"]))
+
+    def test_group_filter_selects_top_level_groups_only(self):
+        with h5py.File(self.filename, "w") as file:
+            for name in ["c1", "foo"]:
+                _create_leaf(
+                    file.create_group(f"{name}/foo"),
+                    "bar",
+                    fields=[("PosCounter", "i4"), ("bar", "f8")],
+                    rows=[(1, 1.0)],
+                )
+        children = paradise.parse_eve_hdf5(
+            self.filename, group_filter=lambda name: name == "c1"
+        )["children"]
+        self.assertListEqual(["c1"], list(children))
+        self.assertIn("foo", children["c1"]["children"])
+
+    def test_small_integers_with_missing_values_are_float32(self):
+        self._create_leaves(
+            {
+                "foo": ("i2", [(1, 1), (2, 2)]),
+                "bar": ("i4", [(1, 1), (3, 3)]),
+                "baz": ("i2", [(1, 1), (2, 2), (3, 3)]),
+            }
+        )
+        data = self._parse_group()["data"]
+        self.assertEqual(np.float32, data["foo"].dtype)
+        self.assertListEqual([1.0, 2.0], list(data["foo"].iloc[:2]))
+        self.assertTrue(np.isnan(data["foo"].iloc[2]))
+        self.assertEqual(np.float64, data["bar"].dtype)
+        self.assertEqual(np.int16, data["baz"].dtype)
+
+    def test_array_channel_arrays_of_same_shape_are_read(self):
+        arrays = {1: np.arange(3.0), 2: np.arange(3.0) * 2, 3: np.ones(3)}
+        self._create_array_channel(arrays)
+        data = self._parse_group()["data"]
+        self.assertListEqual([1, 2, 3], list(data.index))
+        for pos_counter, array in arrays.items():
+            np.testing.assert_array_equal(array, data["channel"][pos_counter])
+
+    def test_array_channel_rows_are_independent(self):
+        self._create_array_channel({1: np.zeros(3), 2: np.zeros(3)})
+        data = self._parse_group()["data"]
+        data["channel"][1][0] = 1.0
+        self.assertEqual(0.0, data["channel"][2][0])
+
+    def test_array_channel_arrays_of_different_shapes_are_read(self):
+        arrays = {1: np.arange(2.0), 2: np.arange(3), 3: np.array([b"foo"])}
+        self._create_array_channel(arrays)
+        data = self._parse_group()["data"]
+        self.assertListEqual([1, 2, 3], list(data.index))
+        for pos_counter, array in arrays.items():
+            np.testing.assert_array_equal(array, data["channel"][pos_counter])
+
+
+class TestSplitColumn(unittest.TestCase):
+    def test_split_column_of_channel(self):
+        self.assertTupleEqual(
+            ("detector", "detector", None, "Count"),
+            paradise._split_column("detector_Count"),
+        )
+
+    def test_split_column_of_normalized_channel(self):
+        self.assertTupleEqual(
+            ("detector__monitor", "detector", "monitor", "AverageCount"),
+            paradise._split_column("detector__monitor_AverageCount"),
+        )
+
+    def test_split_column_is_cached(self):
+        self.assertIs(
+            paradise._split_column("detector_Count"),
+            paradise._split_column("detector_Count"),
+        )
+
+
+class TestEVEMeasurement(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "foo.h5")
+        _create_measurement(self.filename)
+        self.start = datetime.datetime(2020, 2, 1, 10, 0, 0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _create_monitor(self, dtype="i4", rows=None):
+        with h5py.File(self.filename, "a") as file:
+            _create_leaf(
+                file.create_group("device"),
+                "monitor",
+                fields=[("mSecsSinceStart", dtype), ("monitor", "f8")],
+                rows=rows,
+                attrs={"Name": "Monitor"},
+            )
+
+    def _create_statistics(self):
+        with h5py.File(self.filename, "a") as file:
+            main = file["c1/main"]
+            _create_leaf(
+                main.create_group("standarddev"),
+                "detector__Count",
+                fields=[
+                    ("PosCounter", "i4"),
+                    ("Count", "i4"),
+                    ("detector", "f8"),
+                ],
+                rows=[(1, 3, 0.1), (3, 3, 0.2)],
+                attrs={"Channel": "detector"},
+            )
+            _create_leaf(
+                main.create_group("averagemeta"),
+                "detector__AverageCount",
+                fields=[
+                    ("PosCounter", "i4"),
+                    ("AverageCount", "i4"),
+                    ("Attempts", "i4"),
+                ],
+                rows=[(1, 5, 6), (3, 5, 7)],
+                attrs={"Channel": "detector"},
+            )
+
+    def test_statistics_columns_are_translated(self):
+        self._create_statistics()
+        measurement = paradise.EVEMeasurement(self.filename)
+        data = measurement.standard_data
+        for column, values in {
+            "Detector_stddev_count": [3, 3],
+            "Detector_stddev": [0.1, 0.2],
+            "Detector_av_count": [5, 5],
+            "Detector_av_attempts": [6, 7],
+        }.items():
+            with self.subTest(column=column):
+                self.assertListEqual(values, list(data[column].loc[[1, 3]]))
+
+    def test_monitor_timestamps_are_converted_to_datetimes(self):
+        self._create_monitor(rows=[(0, 1.0), (1500, 2.0)])
+        measurement = paradise.EVEMeasurement(self.filename)
+        index = measurement.monitor["Monitor"].index
+        self.assertEqual("datetime", index.name)
+        self.assertListEqual(
+            [self.start, self.start + datetime.timedelta(seconds=1.5)],
+            list(index),
+        )
+
+    def test_missing_monitor_timestamps_are_converted_to_nat(self):
+        self._create_monitor(dtype="f8", rows=[(0, 1.0), (np.nan, 2.0)])
+        measurement = paradise.EVEMeasurement(self.filename)
+        index = measurement.monitor["Monitor"].index
+        self.assertEqual("datetime", index.name)
+        self.assertEqual(self.start, index[0])
+        self.assertIs(pd.NaT, index[1])
+
+
+class TestStandardMeasurement(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "foo.h5")
+        _create_measurement(self.filename)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_data_are_forward_filled_for_motors(self):
+        measurement = paradise.StandardMeasurement(self.filename)
+        self.assertFalse(measurement.data["Motor"].isna().any())
+
+    def test_standard_data_are_not_forward_filled(self):
+        measurement = paradise.StandardMeasurement(self.filename)
+        self.assertTrue(measurement.standard_data["Motor"].isna().any())
+
+    def test_from_measurement_equals_standard_measurement(self):
+        measurement = paradise.StandardMeasurement.from_measurement(
+            paradise.EVEMeasurement(self.filename)
+        )
+        expected = paradise.StandardMeasurement(self.filename)
+        pd.testing.assert_frame_equal(expected.data, measurement.data)
+        self.assertDictEqual(
+            expected.snapshot_before, measurement.snapshot_before
+        )
+
+    def test_from_measurement_raising_keeps_measurement_unchanged(self):
+        _create_measurement(
+            self.filename, snapshots=[(0, -1.0), (3, 2.0), (4, 3.0)]
+        )
+        measurement = paradise.EVEMeasurement(self.filename)
+        with self.assertRaises(ValueError):
+            paradise.StandardMeasurement.from_measurement(measurement)
+        pd.testing.assert_frame_equal(
+            paradise.EVEMeasurement(self.filename).standard_data,
+            measurement.standard_data,
+        )
@@ -1,5 +1,12 @@
+import os
+import sys
+import tempfile
 import unittest
+import weakref
 
+import numpy as np
+
+import evedataviewer
 from evedataviewer import utils
 
 
@@ -16,6 +23,167 @@ class TestListsAreEqual(unittest.TestCase):
     def test_lists_with_different_elements_return_false(self):
         self.assertFalse(utils.lists_are_equal([1, 2, 3], [4, 5, 6]))
 
+    def test_lists_with_unhashable_elements_return_true(self):
+        self.assertTrue(utils.lists_are_equal([[1], [2]], [[2], [1]]))
+
+    def test_lists_with_different_unhashable_elements_return_false(self):
+        self.assertFalse(utils.lists_are_equal([[1], [2]], [[3], [1]]))
+
+
+class TestGetSize(unittest.TestCase):
+    def test_size_of_container_includes_contents(self):
+        items = ["foo" * 100, "bar" * 100]
+        self.assertGreater(utils.get_size(items), sys.getsizeof(items))
+
+    def test_size_of_object_includes_attributes(self):
+        class Foo:
+            def __init__(self):
+                self.bar = np.zeros(1000)
+
+        self.assertGreater(utils.get_size(Foo()), 1000 * 8)
+
+    def test_size_of_object_includes_slots(self):
+        class Foo:
+            __slots__ = ("bar",)
+
+            def __init__(self):
+                self.bar = np.zeros(1000)
+
+        class Bar(Foo):
+            __slots__ = "baz"
+
+            def __init__(self):
+                super().__init__()
+                self.baz = np.zeros(1000)
+
+        self.assertGreater(utils.get_size(Foo()), 1000 * 8)
+        self.assertGreater(utils.get_size(Bar()), 2 * 1000 * 8)
+
+    def test_size_of_array_view_includes_data(self):
+        array = np.zeros(1000)
+        self.assertGreater(utils.get_size(array[:]), 1000 * 8)
+
+    def test_shared_objects_are_counted_once(self):
+        array = np.zeros(1000)
+        self.assertLess(utils.get_size([array, array]), 2 * array.nbytes)
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_set_and_get_item(self):
+        cache = utils.LRUCache()
+        cache["foo"] = "bar"
+        self.assertEqual("bar", cache["foo"])
+
+    def test_exceeding_max_items_discards_oldest_item(self):
+        cache = utils.LRUCache(max_items=2)
+        for key in ["foo", "bar", "baz"]:
+            cache[key] = key
+        self.assertListEqual(["bar", "baz"], list(cache.keys()))
+
+    def test_accessing_item_marks_it_as_recently_used(self):
+        cache = utils.LRUCache(max_items=2)
+        cache["foo"] = "foo"
+        cache["bar"] = "bar"
+        _ = cache["foo"]
+        cache["baz"] = "baz"
+        self.assertListEqual(["foo", "baz"], list(cache.keys()))
+
+    def test_exceeding_max_bytes_discards_oldest_items(self):
+        cache = utils.LRUCache(max_bytes=utils.get_size(np.zeros(1000)) * 2)
+        for key in ["foo", "bar", "baz"]:
+            cache[key] = np.zeros(1000)
+        self.assertListEqual(["bar", "baz"], list(cache.keys()))
+        self.assertLessEqual(cache.size, cache.max_bytes)
+
+    def test_pinned_items_are_not_discarded(self):
+        cache = utils.LRUCache(max_items=1, pinned=["foo"])
+        cache["foo"] = "foo"
+        cache["bar"] = "bar"
+        self.assertIn("foo", cache)
+
+    def test_discarded_items_are_added_to_evicted(self):
+        cache = utils.LRUCache(max_items=1, evicted={})
+        cache["foo"] = 1
+        cache["bar"] = 2
+        self.assertEqual({"foo": 1}, cache.evicted)
+
+    def test_deleting_item_reduces_size(self):
+        cache = utils.LRUCache(max_bytes=10**6)
+        cache["foo"] = np.zeros(1000)
+        cache["bar"] = np.zeros(1000)
+        size = cache.size
+        del cache["foo"]
+        self.assertLess(cache.size, size)
+
+    def test_size_equals_sum_of_item_sizes(self):
+        cache = utils.LRUCache(max_bytes=10**6)
+        cache["foo"] = np.zeros(1000)
+        cache["bar"] = np.zeros(100)
+        cache["foo"] = np.zeros(10)
+        cache.pop("bar")
+        self.assertEqual(utils.get_size(np.zeros(10)), cache.size)
+
+    def test_popitem_and_clear_reduce_size(self):
+        cache = utils.LRUCache(max_bytes=10**6)
+        cache["foo"] = np.zeros(1000)
+        cache["bar"] = np.zeros(1000)
+        cache.popitem()
+        self.assertEqual(utils.get_size(np.zeros(1000)), cache.size)
+        cache.clear()
+        self.assertEqual(0, cache.size)
+
+    def test_accessing_items_while_iterating(self):
+        cache = utils.LRUCache()
+        cache["foo"] = "foo"
+        cache["bar"] = "bar"
+        values = [cache[key] for key in cache]
+        self.assertListEqual(["foo", "bar"], values)
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = utils.DiskCache(
+            directory=os.path.join(self.directory.name, "cache")
+        )
+        self.filename = os.path.join(self.directory.name, "foo.txt")
+        with open(self.filename, "w", encoding="utf8") as file:
+            file.write("foo")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_returns_saved_object(self):
+        self.cache.save(self.filename, {"foo": [1, 2]})
+        self.assertEqual({"foo": [1, 2]}, self.cache.load(self.filename))
+
+    def test_load_without_saved_object_returns_none(self):
+        self.assertIsNone(self.cache.load(self.filename))
+
+    def test_load_for_nonexisting_file_returns_none(self):
+        self.cache.save("bar", "bar")
+        self.assertIsNone(self.cache.load("bar"))
+
+    def test_load_after_changing_file_returns_none(self):
+        self.cache.save(self.filename, "foo")
+        with open(self.filename, "a", encoding="utf8") as file:
+            file.write("bar")
+        self.assertIsNone(self.cache.load(self.filename))
+
+    def test_load_with_other_package_version_returns_none(self):
+        self.cache.save(self.filename, "foo")
+        version = evedataviewer.__version__
+        evedataviewer.__version__ = f"{version}.post1"
+        try:
+            self.assertIsNone(self.cache.load(self.filename))
+        finally:
+            evedataviewer.__version__ = version
+
+    def test_exceeding_max_bytes_removes_objects(self):
+        self.cache.max_bytes = 1
+        self.cache.save(self.filename, "foo")
+        self.assertFalse(os.listdir(self.cache.directory))
+
 
 class TestNotifyingList(unittest.TestCase):
     def setUp(self):
@@ -36,6 +204,41 @@ class TestNotifyingList(unittest.TestCase):
         test_list.remove("foo")
         self.assertTrue(self.called)
 
+    def test_mutating_methods_notify(self):
+        operations = {
+            "extend": lambda x: x.extend(["bar"]),
+            "insert": lambda x: x.insert(0, "bar"),
+            "pop": lambda x: x.pop(),
+            "clear": lambda x: x.clear(),
+            "setitem": lambda x: x.__setitem__(0, "bar"),
+            "delitem": lambda x: x.__delitem__(0),
+            "iadd": lambda x: x.__iadd__(["bar"]),
+        }
+        for name, operation in operations.items():
+            with self.subTest(operation=name):
+                test_list = utils.NotifyingList(["foo"], callback=self.notify)
+                self.called = False
+                operation(test_list)
+                self.assertTrue(self.called)
+
+    def test_initialising_with_items_does_not_notify(self):
+        test_list = utils.NotifyingList(["foo"], callback=self.notify)
+        self.assertListEqual(["foo"], test_list)
+        self.assertFalse(self.called)
+
+    def test_bound_method_as_callback_is_referenced_weakly(self):
+        class Foo:
+            def __init__(self):
+                self.list = utils.NotifyingList(callback=self.bar)
+
+            def bar(self):
+                pass
+
+        foo = Foo()
+        reference = weakref.ref(foo)
+        del foo
+        self.assertIsNone(reference())
+
     def test_append_without_callback_does_not_notify(self):
         test_list = utils.NotifyingList()
         test_list.append("foo")